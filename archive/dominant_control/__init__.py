@@ -8,5 +8,6 @@ __all__ = [
     "tts",
     "voice",
     "watchdog",
+    "workers",
     "ui",
 ]
@@ -6,7 +6,7 @@ import subprocess
 import sys
 import threading
 import tkinter as tk
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 APP_NAME = "DominantControl"
 APP_VERSION = "3.0.0"
@@ -148,9 +148,54 @@ def apply_app_icon(root: tk.Tk) -> None:
             print(f"[ICON] Failed to load {icon_path}: {exc}")
 
 
+# Callables run once before the process restarts or its main window closes,
+# e.g. to write out a pending config save. They run while Tk is still alive.
+_SHUTDOWN_HOOKS: List[Callable[[], None]] = []
+
+
+def register_shutdown_hook(hook: Callable[[], None]):
+    """Run ``hook`` before restart_program() relaunches or the main window closes."""
+
+    _SHUTDOWN_HOOKS.append(hook)
+
+
+def run_shutdown_hooks():
+    """Run and clear the registered shutdown hooks."""
+
+    hooks = _SHUTDOWN_HOOKS[:]
+    _SHUTDOWN_HOOKS.clear()
+    for hook in hooks:
+        try:
+            hook()
+        except Exception as exc:  # noqa: PERF203
+            print(f"[Shutdown] Hook failed: {exc}")
+
+
+def install_close_handler(root: tk.Misc):
+    """Run the shutdown hooks when the main window is closed, before destroy.
+
+    Any WM_DELETE_WINDOW handler already installed is still invoked afterwards;
+    without one the window is destroyed as Tk would by default.
+    """
+
+    previous = root.protocol("WM_DELETE_WINDOW")
+
+    def _on_close():
+        run_shutdown_hooks()
+        if previous:
+            root.tk.call(previous)
+        else:
+            root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", _on_close)
+
+
 def restart_program():
     """Restart the application by closing and relaunching the process."""
 
+    # Before spawning, so the new process reads the saved config
+    run_shutdown_hooks()
+
     python = sys.executable
     script = os.path.abspath(sys.argv[0])
     args = [python, script, *sys.argv[1:]]
@@ -216,7 +261,10 @@ __all__ = [
     "_TTS_THREAD",
     "apply_app_icon",
     "consume_pending_scan",
+    "install_close_handler",
     "mark_pending_scan",
+    "register_shutdown_hook",
     "resolve_resource_path",
     "restart_program",
+    "run_shutdown_hooks",
 ]
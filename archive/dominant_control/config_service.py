@@ -3,19 +3,107 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
+import os
+import queue
+import threading
+from typing import Any, Dict, Optional
 
 from dominant_control import config as config_module
-from dominant_control.config import CONFIG_FILE, DEFAULT_OVERLAY_FEEDBACK
+from dominant_control.config import (
+    CONFIG_FILE,
+    DEFAULT_OVERLAY_FEEDBACK,
+    register_shutdown_hook,
+)
 from dominant_control.input_engine import _normalize_timing_config
 from dominant_control.input_manager import input_manager
 
+# One background writer per process, since there is a single config file.
+# Serialized payloads wait here; only the newest queued one is written.
+_write_queue: "queue.Queue[str]" = queue.Queue()
+_writer: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+# Set while the config file is being deleted; saves are dropped meanwhile.
+_writes_suspended = False
+
+
+def suspend_config_writes() -> None:
+    """Drop unwritten saves and ignore new ones, e.g. before deleting the file.
+
+    Returns once any write already in progress has finished.
+    """
+
+    global _writes_suspended
+    _writes_suspended = True
+    try:
+        while True:
+            _write_queue.get_nowait()
+            _write_queue.task_done()
+    except queue.Empty:
+        pass
+    _write_queue.join()
+
+
+def resume_config_writes() -> None:
+    """Accept saves again after suspend_config_writes()."""
+
+    global _writes_suspended
+    _writes_suspended = False
+
+
+def _enqueue_write(text: str) -> None:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(
+                target=_write_worker, name="dc-config-writer", daemon=True
+            )
+            _writer.start()
+    _write_queue.put(text)
+
+
+def _write_worker() -> None:
+    while True:
+        text = _write_queue.get()
+        taken = 1
+        # Only the newest snapshot needs to reach the disk
+        try:
+            while True:
+                text = _write_queue.get_nowait()
+                taken += 1
+        except queue.Empty:
+            pass
+
+        try:
+            if not _writes_suspended:
+                _write_file(text)
+        finally:
+            for _ in range(taken):
+                _write_queue.task_done()
+
+
+def _write_file(text: str) -> None:
+    """Replace the config file atomically so a crash never truncates it."""
+
+    tmp_path = f"{CONFIG_FILE}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(tmp_path, CONFIG_FILE)
+    except Exception as exc:
+        print(f"[Config] Failed to save configuration: {exc}")
+
 
 class ConfigService:
     """Serialize and hydrate application state from the config file."""
 
+    # Quiet period after the last schedule_save() before the file is written
+    SAVE_DEBOUNCE_MS = 400
+
     def __init__(self, app: Any):
         self.app = app
+        self._save_after_id: Optional[str] = None
+        # Pending debounced saves must reach the disk on restart and close
+        register_shutdown_hook(self.flush_pending_save)
 
     # ------------------------------------------------------------------
     # Public API
@@ -35,12 +123,39 @@ class ConfigService:
     def save(self) -> None:
         """Collect the current application state and persist it."""
 
+        self._cancel_scheduled_save()
+        if _writes_suspended:
+            return
         payload = self._build_payload()
         self._write_config(payload)
 
+    def schedule_save(self) -> None:
+        """Save once the current burst of edits has settled."""
+
+        root = self.app.root
+        if self._save_after_id is not None:
+            root.after_cancel(self._save_after_id)
+        self._save_after_id = root.after(self.SAVE_DEBOUNCE_MS, self._flush_save)
+
+    def flush_pending_save(self) -> None:
+        """Write a scheduled save now and wait for the writer, e.g. before shutdown."""
+
+        if self._save_after_id is not None:
+            self.save()
+        _write_queue.join()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _flush_save(self) -> None:
+        self._save_after_id = None
+        self.save()
+
+    def _cancel_scheduled_save(self) -> None:
+        if self._save_after_id is not None:
+            self.app.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+
     def _read_config(self) -> Dict[str, Any]:
         try:
             with open(CONFIG_FILE, "r", encoding="utf-8") as handle:
@@ -49,11 +164,15 @@ class ConfigService:
             return {}
 
     def _write_config(self, payload: Dict[str, Any]) -> None:
+        # Serialize here: the payload references live app state that only
+        # the Tk thread may touch. The disk write happens on the writer.
         try:
-            with open(CONFIG_FILE, "w", encoding="utf-8") as handle:
-                json.dump(payload, handle, indent=4)
+            text = json.dumps(payload, indent=4)
         except Exception as exc:
             print(f"[Config] Failed to save configuration: {exc}")
+            return
+
+        _enqueue_write(text)
 
     def _build_payload(self) -> Dict[str, Any]:
         car = self.app.current_car or "Generic Car"
@@ -73,6 +192,7 @@ class ConfigService:
             "voice_engine": self.app.voice_engine.get(),
             "vosk_model_path": self.app.vosk_model_path.get(),
             "voice_tuning": self.app._voice_tuning_config(),
+            "registered_actions": self.app.voice_control.registration_snapshot(),
             "microphone_device": self.app.microphone_device.get(),
             "audio_output_device": self.app.audio_output_device.get(),
             "auto_detect": self.app.auto_detect.get(),
@@ -116,6 +236,7 @@ class ConfigService:
         self.app._set_voice_tuning_vars(
             data.get("voice_tuning", config_module.VOICE_TUNING_DEFAULTS)
         )
+        self.app.voice_control.prime_from_snapshot(data.get("registered_actions"))
         self.app.auto_detect.set(data.get("auto_detect", True))
         self.app.auto_restart_on_rescan.set(data.get("auto_restart_on_rescan", True))
         self.app.auto_restart_on_race.set(data.get("auto_restart_on_race", True))
@@ -1,10 +1,19 @@
+import threading
 import time
+import weakref
 from typing import Any, Callable, Dict, Optional
 
 from dominant_control.input_engine import _direct_pulse, click_pulse
 from dominant_control.tts import speak_text
 
 
+def _round_int(value) -> int:
+    """Round a telemetry value to int, passing through values that already are."""
+    if type(value) is int:
+        return value
+    return int(round(value))
+
+
 class GenericController:
     """
     Controller for adjusting a single telemetry variable via key presses.
@@ -20,13 +29,58 @@ class GenericController:
     ):
         self.ir = ir_instance
         self.var_name = var_name
+        self.short_name = var_name.replace("dc", "")
         self.is_float = is_float
+        # Telemetry conversion chosen once for the variable type
+        self._convert: Callable[[Any], Any] = float if is_float else _round_int
         self.running_action = False
-        self.key_increase = None
-        self.key_decrease = None
+        # Set by cancel() to stop a running adjustment between pulses
+        self._cancel = threading.Event()
+        self._key_increase = None
+        self._key_decrease = None
+        # Detected float increment per car; the probe costs two pulses
+        self._float_step_cache: Dict[Any, float] = {}
+        # Bound SDK accessor, set once the connection is known to be up
+        self._ir_get: Optional[Callable[[str], Any]] = None
         self.update_status = status_callback
+        # The app owns its controllers; a weak back-reference avoids a cycle
+        self._app_ref: Optional[weakref.ReferenceType] = None
         self.app = app_ref
 
+    @property
+    def app(self):
+        ref = self._app_ref
+        return ref() if ref is not None else None
+
+    @app.setter
+    def app(self, app_ref) -> None:
+        self._app_ref = weakref.ref(app_ref) if app_ref is not None else None
+
+    @property
+    def key_increase(self):
+        return self._key_increase
+
+    @key_increase.setter
+    def key_increase(self, key) -> None:
+        if key != self._key_increase:
+            self._float_step_cache.clear()
+        self._key_increase = key
+
+    @property
+    def key_decrease(self):
+        return self._key_decrease
+
+    @key_decrease.setter
+    def key_decrease(self, key) -> None:
+        if key != self._key_decrease:
+            self._float_step_cache.clear()
+        self._key_decrease = key
+
+    def cancel(self) -> None:
+        """Stop a running adjust_to_target at its next poll."""
+
+        self._cancel.set()
+
     def read_telemetry(self) -> Optional[float]:
         """
         Read current value of the controlled variable.
@@ -34,48 +88,61 @@ class GenericController:
         Returns:
             Current value or None if unavailable
         """
-        try:
-            if not getattr(self.ir, "is_initialized", False):
-                try:
-                    self.ir.startup()
-                except Exception:
-                    return None
+        ir_get = self._ir_get
+        if ir_get is None:
+            if not self._ensure_ir():
+                return None
+            ir_get = self._ir_get = self.ir.__getitem__
 
-            value = self.ir[self.var_name]
+        try:
+            value = ir_get(self.var_name)
             if value is None:
+                # Re-check the connection on the next read
+                self._ir_get = None
                 return None
 
-            if self.is_float:
-                return float(value)
-            else:
-                return int(round(value))
+            return self._convert(value)
         except Exception:
+            self._ir_get = None
             return None
 
-    def _detect_float_step(self) -> Optional[float]:
-        """Detect the minimal float increment by pulsing once and restoring."""
+    def _ensure_ir(self) -> bool:
+        """Start the SDK connection if needed; return True when it is usable."""
+        if getattr(self.ir, "is_initialized", False):
+            return True
+        try:
+            self.ir.startup()
+        except Exception:
+            return False
+        return True
+
+    def _detect_float_step(self, baseline: float, increase: bool) -> Optional[float]:
+        """
+        Detect the minimal float increment with one pulse toward the target.
+
+        The pulse is not undone; it counts as the first step of the
+        adjustment, so the caller continues from the new value.
+
+        Args:
+            baseline: Value read before the pulse
+            increase: Pulse the increase key instead of the decrease key
+
+        Returns:
+            Measured increment, or None if the value did not move
+        """
         if not self.is_float:
             return None
         if not self.key_increase or not self.key_decrease:
             return None
 
-        baseline = self.read_telemetry()
-        if baseline is None:
-            return None
-
-        # Pulse upward and measure the delta
-        click_pulse(self.key_increase, is_float=True)
+        click_pulse(self.key_increase if increase else self.key_decrease, is_float=True)
         time.sleep(0.08)
-        raised = self.read_telemetry()
+        moved = self.read_telemetry()
 
-        if raised is None:
+        if moved is None:
             return None
 
-        step = abs(float(raised) - float(baseline))
-
-        # Try to return near the starting point
-        click_pulse(self.key_decrease, is_float=True)
-        time.sleep(0.08)
+        step = abs(float(moved) - float(baseline))
 
         if step < 1e-6:
             return None
@@ -87,25 +154,22 @@ class GenericController:
         if not self.is_float:
             return target
 
-        step = self._detect_float_step()
         current = self.read_telemetry()
-
-        if step is None or step <= 0 or current is None:
+        if current is None:
             return target
 
-        aligned = current + round((target - current) / step) * step
+        car = self.app.current_car if self.app else None
+        step = self._float_step_cache.get(car)
+        if step is None and abs(target - current) >= 0.001:
+            step = self._detect_float_step(current, target > current)
+            if step is not None:
+                self._float_step_cache[car] = step
+            current = self.read_telemetry()
 
-        if abs(aligned - target) >= 0.0005:
-            if self.update_status:
-                self.update_status(f"Rounded to {aligned:.3f}", "orange")
-            if self.app:
-                short_name = self.var_name.replace("dc", "")
-                self.app.notify_overlay_status(
-                    f"{short_name}: using {aligned:.3f} (nearest)",
-                    "orange"
-                )
+        if step is None or step <= 0 or current is None:
+            return target
 
-        return aligned
+        return current + round((target - current) / step) * step
 
     def adjust_to_target(self, target: float):
         """
@@ -117,38 +181,47 @@ class GenericController:
         if self.running_action:
             return
 
+        app = self.app
+
         if not self.key_increase or not self.key_decrease:
             if self.update_status:
                 self.update_status("No keys configured", "red")
-            if self.app:
-                self.app.notify_overlay_status(
-                    f"{self.var_name.replace('dc', '')}: No keys",
+            if app:
+                app.notify_overlay_status(
+                    f"{self.short_name}: No keys",
                     "red"
                 )
             return
 
         self.running_action = True
-        short_name = self.var_name.replace("dc", "")
+        cancel = self._cancel
+        cancel.clear()
+        short_name = self.short_name
 
+        requested = target
         target = self._resolve_target(target)
         if not self.is_float:
             target = int(round(target))
+        # Reported with the final status rather than as a separate update
+        rounded = self.is_float and abs(target - requested) >= 0.0005
 
         if self.update_status:
             self.update_status("Adjusting...", "orange")
-        if self.app:
-            self.app.notify_overlay_status(
+        if app:
+            app.notify_overlay_status(
                 f"Adjusting {short_name} -> {target}",
                 "orange"
             )
 
-        timeout = time.time() + 8
+        # Monotonic deadline: wall-clock adjustments cannot cut the loop short
+        monotonic = time.monotonic
+        deadline = monotonic() + 8.0
         success = False
 
         try:
-            while time.time() < timeout:
+            while monotonic() < deadline:
                 # Abort if entering CONFIG mode
-                if self.app and self.app.app_state != "RUNNING":
+                if app and app.app_state != "RUNNING":
                     break
 
                 current = self.read_telemetry()
@@ -169,33 +242,34 @@ class GenericController:
                 # Press appropriate key
                 key = self.key_increase if diff > 0 else self.key_decrease
                 click_pulse(key, self.is_float)
-                time.sleep(0.02)
+                # Wait for telemetry to follow the pulse; wakes early on cancel()
+                if cancel.wait(0.02):
+                    break
 
         except Exception as e:
             print(f"[GenericController] Exception: {e}")
         finally:
             if success:
-                message = f"{short_name} OK ({target})"
+                message = (
+                    f"{short_name} OK ({target:.3f}, nearest)"
+                    if rounded
+                    else f"{short_name} OK ({target})"
+                )
                 if self.update_status:
                     self.update_status("Ready", "green")
-                if self.app:
-                    self.app.notify_overlay_status(message, "green")
-                    if self.app.use_tts.get():
+                if app:
+                    app.notify_overlay_status(message, "green")
+                    if app.use_tts.get():
                         speak_text(message)
             else:
                 status = "Cancelled" if (
-                    self.app and self.app.app_state != "RUNNING"
+                    cancel.is_set() or (app and app.app_state != "RUNNING")
                 ) else "Failed"
 
                 if self.update_status:
                     self.update_status(status, "red")
-                if self.app:
-                    status_msg = (
-                        f"{short_name} Cancelled"
-                        if self.app.app_state != "RUNNING"
-                        else f"{short_name} Failed"
-                    )
-                    self.app.notify_overlay_status(status_msg, "red")
+                if app:
+                    app.notify_overlay_status(f"{short_name} {status}", "red")
 
             self.running_action = False
 
@@ -210,9 +284,9 @@ class GenericController:
         """
         Probe the minimal pulse timing that reliably updates telemetry.
 
-        The probe fires fast pulses starting at ``start_ms`` and increments by
-        ``step_ms`` until telemetry reflects a change. The first timing that
-        consistently registers is returned.
+        Timings from ``start_ms`` to ``max_ms`` in ``step_ms`` increments are
+        bisected, assuming that any timing at or above a working one also
+        works. The smallest timing that consistently registers is returned.
 
         Args:
             start_ms: Initial press/interval duration in milliseconds.
@@ -232,12 +306,17 @@ class GenericController:
         if baseline is None:
             return None
 
-        def _changed(old, new) -> bool:
-            if old is None or new is None:
-                return False
-            if self.is_float:
+        # Pick the comparison once instead of branching on every reading
+        if self.is_float:
+            def _changed(old, new) -> bool:
+                if old is None or new is None:
+                    return False
                 return abs(float(new) - float(old)) >= 0.0005
-            return int(round(new)) != int(round(old))
+        else:
+            def _changed(old, new) -> bool:
+                if old is None or new is None:
+                    return False
+                return int(round(new)) != int(round(old))
 
         def _restore(target_value: float, timing_ms: int):
             """Attempt to revert telemetry back near baseline after a test."""
@@ -251,7 +330,7 @@ class GenericController:
                 _direct_pulse(direction, timing_ms, timing_ms)
                 time.sleep(settle_s)
 
-        for delay_ms in range(max(1, start_ms), max_ms + 1, max(1, step_ms)):
+        def _try(delay_ms: int) -> bool:
             success_count = 0
             for _ in range(max(1, confirmation_attempts)):
                 _direct_pulse(self.key_increase, delay_ms, delay_ms)
@@ -263,8 +342,17 @@ class GenericController:
                     break
 
             _restore(baseline, delay_ms)
+            return success_count >= confirmation_attempts
+
+        timings = range(max(1, start_ms), max_ms + 1, max(1, step_ms))
+        best: Optional[int] = None
+        lo, hi = 0, len(timings) - 1
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            if _try(timings[mid]):
+                best = timings[mid]
+                hi = mid - 1
+            else:
+                lo = mid + 1
 
-            if success_count >= confirmation_attempts:
-                return delay_ms
-
-        return None
+        return best
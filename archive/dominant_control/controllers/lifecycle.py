@@ -5,7 +5,15 @@ from __future__ import annotations
 import os
 from tkinter import messagebox
 
-from dominant_control.config import CONFIG_FILE, mark_pending_scan
+from dominant_control.config import (
+    CONFIG_FILE,
+    install_close_handler,
+    mark_pending_scan,
+)
+from dominant_control.config_service import (
+    resume_config_writes,
+    suspend_config_writes,
+)
 
 
 class LifecycleManager:
@@ -13,6 +21,10 @@ class LifecycleManager:
 
     def __init__(self, app):
         self.app = app
+        # Flush pending saves and stop workers while the widgets still exist
+        root = getattr(app, "root", None)
+        if root is not None:
+            install_close_handler(root)
 
     def handle_session_change(self, session_type: str) -> bool:
         """Handle session transitions and restart if entering a race."""
@@ -56,10 +68,14 @@ class LifecycleManager:
         ):
             return
 
+        # A queued or scheduled save must not re-create the file afterwards
+        suspend_config_writes()
         try:
-            if os.path.exists(CONFIG_FILE):
-                os.remove(CONFIG_FILE)
-        except Exception as exc:  # noqa: PERF203
+            os.remove(CONFIG_FILE)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            resume_config_writes()
             messagebox.showerror(
                 "Error",
                 f"Failed to delete config: {exc}",
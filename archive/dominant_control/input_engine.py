@@ -1,10 +1,11 @@
 """Low-level input helpers built on Windows SendInput."""
 
 import ctypes
+import functools
 import os
 import random
 import time
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from .config import DEFAULT_TIMING_PROFILES, GLOBAL_TIMING
 
@@ -18,6 +19,12 @@ else:
 
 PUL = ctypes.POINTER(ctypes.c_ulong)
 
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_SCANCODE = 0x0008
+
+TIMING_PROFILES = frozenset({"aggressive", "casual", "relaxed", "custom", "bot"})
+
 
 class KeyBdInput(ctypes.Structure):
     """Keyboard input structure for SendInput."""
@@ -73,30 +80,56 @@ class Input(ctypes.Structure):
     ]
 
 
-def press_key(scan_code: int):
-    """Press a key using its scan code."""
+# The platform check is resolved once here instead of on every key event.
+if SendInput is not None:
+
+    def send_batch(events: Sequence[Tuple[int, bool]]):
+        """Send several scan-code events with a single SendInput call.
+
+        Args:
+            events: Sequence of (scan_code, key_up) pairs, injected in order.
+        """
+
+        count = len(events)
+        if not count:
+            return
+
+        extra = ctypes.c_ulong(0)
+        extra_ptr = ctypes.pointer(extra)
+        inputs = (Input * count)()
+        for slot, (scan_code, key_up) in zip(inputs, events):
+            flags = KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP if key_up else KEYEVENTF_SCANCODE
+            slot.type = INPUT_KEYBOARD
+            slot.ii.ki = KeyBdInput(0, scan_code, flags, 0, extra_ptr)
+        SendInput(count, inputs, ctypes.sizeof(Input))
+
+    def press_key(scan_code: int):
+        """Press a key using its scan code."""
+
+        send_batch(((scan_code, False),))
+
+    def release_key(scan_code: int):
+        """Release a key using its scan code."""
 
-    if SendInput is None:
-        raise OSError("SendInput APIs are only available on Windows platforms.")
+        send_batch(((scan_code, True),))
 
-    extra = ctypes.c_ulong(0)
-    ii_ = Input_I()
-    ii_.ki = KeyBdInput(0, scan_code, 0x0008, 0, ctypes.pointer(extra))
-    x = Input(ctypes.c_ulong(1), ii_)
-    SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+else:
+    _SEND_INPUT_MISSING = "SendInput APIs are only available on Windows platforms."
+
+    def send_batch(events: Sequence[Tuple[int, bool]]):
+        """Unavailable without SendInput."""
+
+        raise OSError(_SEND_INPUT_MISSING)
 
+    def press_key(scan_code: int):
+        """Unavailable without SendInput."""
 
-def release_key(scan_code: int):
-    """Release a key using its scan code."""
+        raise OSError(_SEND_INPUT_MISSING)
 
-    if SendInput is None:
-        raise OSError("SendInput APIs are only available on Windows platforms.")
+    def release_key(scan_code: int):
+        """Unavailable without SendInput."""
 
-    extra = ctypes.c_ulong(0)
-    ii_ = Input_I()
-    ii_.ki = KeyBdInput(0, scan_code, 0x0008 | 0x0002, 0, ctypes.pointer(extra))
-    x = Input(ctypes.c_ulong(1), ii_)
-    SendInput(1, ctypes.pointer(x), ctypes.sizeof(x))
+        raise OSError(_SEND_INPUT_MISSING)
 
 
 def _normalize_timing_config(timing: Dict[str, Any]) -> Dict[str, Any]:
@@ -108,8 +141,7 @@ def _normalize_timing_config(timing: Dict[str, Any]) -> Dict[str, Any]:
 
     normalized.update(timing)
 
-    allowed_profiles = {"aggressive", "casual", "relaxed", "custom", "bot"}
-    if normalized.get("profile") not in allowed_profiles:
+    if normalized.get("profile") not in TIMING_PROFILES:
         normalized["profile"] = "aggressive"
 
     profile_settings: Dict[str, Dict[str, Any]] = {}
@@ -184,13 +216,62 @@ def _effective_profile_settings(
     return DEFAULT_TIMING_PROFILES[profile]
 
 
+def _finalize_timing(
+    profile: str, press_ms: float, interval_ms: float, is_float: bool
+) -> Tuple[float, float]:
+    """Clamp raw millisecond timings for the profile and convert to seconds."""
+
+    min_value = 1 if profile == "bot" else 10
+    press_ms = max(min_value, press_ms)
+    interval_ms = max(min_value, interval_ms)
+
+    if is_float and profile != "bot":
+        press_ms += 30
+
+    return press_ms / 1000.0, interval_ms / 1000.0
+
+
+@functools.lru_cache(maxsize=16)
+def _timing_for_profile(profile: str, is_float: bool) -> Optional[Tuple[float, float]]:
+    """Return fixed timing for an uncustomized profile, or None if it varies.
+
+    Only the built-in profile defaults are consulted, so the cached values never
+    go stale when the user edits timings.
+    """
+
+    settings = DEFAULT_TIMING_PROFILES[profile]
+    press_ms = settings["press_min_ms"]
+    interval_ms = settings["interval_min_ms"]
+    if (
+        settings["random_enabled"]
+        or press_ms != settings["press_max_ms"]
+        or interval_ms != settings["interval_max_ms"]
+    ):
+        return None
+
+    return _finalize_timing(profile, press_ms, interval_ms, is_float)
+
+
 def _compute_timing(is_float: bool = False) -> Tuple[float, float]:
     """Compute press and interval timing based on global profile."""
 
-    timing_cfg = _normalize_timing_config(GLOBAL_TIMING)
-    profile = timing_cfg.get("profile", "aggressive")
+    profile = GLOBAL_TIMING.get("profile", "aggressive")
+    if profile not in TIMING_PROFILES:
+        profile = "aggressive"
+
+    customized = GLOBAL_TIMING.get("profile_customized")
+    if profile == "custom" or (
+        isinstance(customized, dict) and customized.get(profile, False)
+    ):
+        # Only user-edited settings need the full sanitizing pass.
+        timing_cfg = _normalize_timing_config(GLOBAL_TIMING)
+        settings = _effective_profile_settings(timing_cfg, profile)
+    else:
+        fixed = _timing_for_profile(profile, is_float)
+        if fixed is not None:
+            return fixed
+        settings = DEFAULT_TIMING_PROFILES[profile]
 
-    settings = _effective_profile_settings(timing_cfg, profile)
     p_min = settings.get("press_min_ms", 60)
     p_max = settings.get("press_max_ms", 80)
     i_min = settings.get("interval_min_ms", 60)
@@ -203,14 +284,7 @@ def _compute_timing(is_float: bool = False) -> Tuple[float, float]:
         press_ms += random.uniform(-rng, rng)
         interval_ms += random.uniform(-rng, rng)
 
-    min_value = 1 if profile == "bot" else 10
-    press_ms = max(min_value, press_ms)
-    interval_ms = max(min_value, interval_ms)
-
-    if is_float and profile != "bot":
-        press_ms += 30
-
-    return press_ms / 1000.0, interval_ms / 1000.0
+    return _finalize_timing(profile, press_ms, interval_ms, is_float)
 
 
 def click_pulse(scan_code: Optional[int], is_float: bool = False):
@@ -248,9 +322,11 @@ def _direct_pulse(scan_code: Optional[int], press_ms: int, interval_ms: int):
 __all__ = [
     "IS_WINDOWS",
     "PUL",
+    "TIMING_PROFILES",
     "click_pulse",
     "press_key",
     "release_key",
+    "send_batch",
     "_compute_timing",
     "_direct_pulse",
     "_normalize_timing_config",
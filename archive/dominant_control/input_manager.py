@@ -18,8 +18,14 @@ class InputManager:
     Supports safe mode (keyboard only) and selective device enabling.
     """
 
+    # Minimum spacing between input loop heartbeats sent to the watchdog.
+    _BEAT_INTERVAL_S = 0.5
+
     def __init__(self):
-        self.joysticks: List[Any] = []
+        # (joystick, id, button count) per connected device; fixed for a handle's lifetime
+        self._joystick_infos: List[Tuple[Any, int, int]] = []
+        # Joystick id -> precomputed "JOY:<id>:<button>" codes indexed by button
+        self._code_lut: Dict[int, Tuple[str, ...]] = {}
         self.listeners: Dict[str, Callable] = {}  # Input code -> callback
         self.active: bool = False
         self.allowed_devices: List[str] = []
@@ -111,7 +117,8 @@ class InputManager:
         if self.safe_mode or not HAS_PYGAME:
             return
 
-        self.joysticks.clear()
+        self._joystick_infos.clear()
+        self._code_lut.clear()
         self.allowed_devices = list(allowed_names)
 
         try:
@@ -129,7 +136,12 @@ class InputManager:
                 if j.get_name() in self.allowed_devices:
                     try:
                         j.init()
-                        self.joysticks.append(j)
+                        joy_id = j.get_id()
+                        num_buttons = j.get_numbuttons()
+                        self._joystick_infos.append((j, joy_id, num_buttons))
+                        self._code_lut[joy_id] = tuple(
+                            f"JOY:{joy_id}:{b}" for b in range(num_buttons)
+                        )
                         print(f"[InputManager] Connected: {j.get_name()}")
                     except Exception:
                         pass
@@ -164,26 +176,53 @@ class InputManager:
         self._start_input_loop(force=True)
 
     def _input_loop_with_watchdog(self):
-        """Background loop to capture joystick events and feed watchdog."""
+        """Background loop to capture joystick events and feed watchdog.
+
+        Blocks in ``pygame.event.wait`` so the thread only wakes when an event
+        arrives, with an upper bound so the watchdog still gets its heartbeat.
+        Heartbeats are rate-limited so bursts of events do not touch the
+        watchdog on every iteration.
+        """
+        # Bind hot lookups once; listeners and the code table are only ever
+        # mutated in place.
+        listeners = self.listeners
+        beat = self._input_watchdog.beat
+        beat_interval = self._BEAT_INTERVAL_S
+        monotonic = time.monotonic
+        sleep = time.sleep
+        start_thread = threading.Thread
+        code_lut = self._code_lut
+        if HAS_PYGAME:
+            get_init = pygame.get_init
+            wait_event = pygame.event.wait
+            joy_button_down = pygame.JOYBUTTONDOWN
+
+        last_beat = 0.0
         while True:
             try:
-                if not self.safe_mode and HAS_PYGAME and pygame.get_init():
-                    pygame.event.pump()
-                    if self.active:
-                        events = pygame.event.get()
-                        for event in events:
-                            if event.type == pygame.JOYBUTTONDOWN:
-                                code = f"JOY:{event.joy}:{event.button}"
-                                if code in self.listeners:
-                                    threading.Thread(
-                                        target=self.listeners[code],
-                                        daemon=True
-                                    ).start()
+                if not self.safe_mode and HAS_PYGAME and get_init():
+                    event = wait_event(timeout=250)
+                    if (
+                        event.type == joy_button_down
+                        and listeners
+                        and self.active
+                    ):
+                        try:
+                            code = code_lut[event.joy][event.button]
+                        except (KeyError, IndexError):
+                            code = f"JOY:{event.joy}:{event.button}"
+                        callback = listeners.get(code)
+                        if callback is not None:
+                            start_thread(target=callback, daemon=True).start()
+                else:
+                    sleep(0.25)
             except Exception:
-                pass
-            finally:
-                self._input_watchdog.beat()
-            time.sleep(0.01)
+                sleep(0.25)
+
+            now = monotonic()
+            if now - last_beat >= beat_interval:
+                beat()
+                last_beat = now
 
     def capture_any_input(self, timeout: float = 10.0) -> Optional[str]:
         """
@@ -220,11 +259,11 @@ class InputManager:
                 if not self.safe_mode and HAS_PYGAME and pygame.get_init():
                     try:
                         pygame.event.pump()
-                        for joy in self.joysticks:
+                        for joy, joy_id, num_buttons in self._joystick_infos:
                             try:
-                                for b_idx in range(joy.get_numbuttons()):
+                                for b_idx in range(num_buttons):
                                     if joy.get_button(b_idx):
-                                        captured_code = f"JOY:{joy.get_id()}:{b_idx}"
+                                        captured_code = f"JOY:{joy_id}:{b_idx}"
                                         break
                             except Exception:
                                 pass
@@ -1,9 +1,50 @@
-from .widgets import ScrollableFrame
-from .control_tab import ControlTab
-from .combo_tab import ComboTab
+"""Tkinter UI components for Dominant Control.
+
+Submodules are imported lazily on first attribute access so that importing
+``dominant_control.ui`` does not pull in every Tk widget module up front.
+"""
+
+import importlib
+from typing import Any, Dict
+
+_LAZY_ATTRS: Dict[str, str] = {
+    "ComboTab": ".combo_tab",
+    "ControlTab": ".control_tab",
+    "DeviceSelector": ".device_selector",
+    "GlobalTimingWindow": ".timing_window",
+    "OverlayConfigTab": ".overlay_config",
+    "OverlayFeedbackManager": ".overlay_feedback",
+    "OverlayManager": ".overlay_manager",
+    "OverlayWindow": ".overlay_window",
+    "ScrollableFrame": ".widgets",
+    "VoiceAudioControls": ".voice_audio",
+    "build_voice_audio_window": ".voice_audio",
+}
 
 __all__ = [
-    "ScrollableFrame",
-    "ControlTab",
     "ComboTab",
+    "ControlTab",
+    "DeviceSelector",
+    "GlobalTimingWindow",
+    "OverlayConfigTab",
+    "OverlayFeedbackManager",
+    "OverlayManager",
+    "OverlayWindow",
+    "ScrollableFrame",
+    "VoiceAudioControls",
+    "build_voice_audio_window",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
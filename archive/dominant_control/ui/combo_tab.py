@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import tkinter as tk
 from tkinter import messagebox, ttk
@@ -77,12 +77,13 @@ class ComboTab(tk.Frame):
         self.presets_container = tk.Frame(body)
         self.presets_container.pack(fill="both", expand=True, padx=5, pady=5)
 
-        tk.Button(
+        self.btn_add_row = tk.Button(
             body,
             text="Add Row (+)",
             command=self.add_dynamic_row,
             bg="#f0f0f0"
-        ).pack(fill="x", padx=5, pady=(0, 5))
+        )
+        self.btn_add_row.pack(fill="x", padx=5, pady=(0, 5))
 
         # Add initial rows
         self.add_dynamic_row(is_reset=True)
@@ -202,6 +203,11 @@ class ComboTab(tk.Frame):
         if self.app.app_state != "CONFIG":
             voice_entry.config(state="readonly")
         row_data["voice_entry"] = voice_entry
+        # Bound once so get_config does not resolve them per save
+        row_data["entry_gets"] = tuple(
+            (var_name, entry.get) for var_name, entry in row_data["entries"].items()
+        )
+        row_data["voice_get"] = voice_entry.get
 
         self.preset_rows.append(row_data)
 
@@ -219,44 +225,45 @@ class ComboTab(tk.Frame):
         """Get current combo configuration."""
         presets_data = []
         for row in self.preset_rows:
-            values = {
-                var_name: entry.get()
-                for var_name, entry in row["entries"].items()
-            }
             presets_data.append({
-                "vals": values,
+                "vals": {var_name: get() for var_name, get in row["entry_gets"]},
                 "bind": row["bind"],
                 "is_reset": row["is_reset"],
-                "voice_phrase": (
-                    row.get("voice_entry").get() if row.get("voice_entry") else ""
-                )
+                "voice_phrase": row["voice_get"](),
             })
         return {"presets": presets_data}
 
     def set_config(self, config: Dict[str, Any]):
         """Load combo configuration."""
-        # Clear existing rows
-        for row in list(self.preset_rows):
-            row["frame"].destroy()
-        self.preset_rows.clear()
-
-        if not config:
-            self.add_dynamic_row(is_reset=True)
-            for _ in range(2):
-                self.add_dynamic_row()
-            return
+        # Clear and rebuild rows while the container is unmanaged, so the
+        # layout is recomputed once when it is packed back.
+        self.presets_container.pack_forget()
+        try:
+            for row in list(self.preset_rows):
+                row["frame"].destroy()
+            self.preset_rows.clear()
+
+            if not config:
+                self.add_dynamic_row(is_reset=True)
+                for _ in range(2):
+                    self.add_dynamic_row()
+                return
 
-        saved_presets = config.get("presets", [])
-        has_reset = any(p.get("is_reset") for p in saved_presets)
+            saved_presets = config.get("presets", [])
+            has_reset = any(p.get("is_reset") for p in saved_presets)
 
-        if not has_reset:
-            self.add_dynamic_row(is_reset=True)
+            if not has_reset:
+                self.add_dynamic_row(is_reset=True)
 
-        for preset in saved_presets:
-            self.add_dynamic_row(
-                existing=preset,
-                is_reset=preset.get("is_reset", False)
-            )
+            for preset in saved_presets:
+                self.add_dynamic_row(
+                    existing=preset,
+                    is_reset=preset.get("is_reset", False)
+                )
 
-        if len(self.preset_rows) < 2:
-            self.add_dynamic_row()
+            if len(self.preset_rows) < 2:
+                self.add_dynamic_row()
+        finally:
+            self.presets_container.pack(
+                fill="both", expand=True, padx=5, pady=5, before=self.btn_add_row
+            )
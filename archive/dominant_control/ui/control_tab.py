@@ -1,4 +1,3 @@
-import threading
 from typing import Any, Dict, List, Optional
 
 import tkinter as tk
@@ -6,12 +5,40 @@ from tkinter import messagebox, ttk
 
 from dominant_control.controllers import GenericController
 from dominant_control.input_manager import input_manager
+from dominant_control.workers import DaemonWorkerPool
 from .widgets import ScrollableFrame
 
+_HINT_LABEL_OPTIONS = {
+    "fg": "gray",
+    "font": ("Arial", 8),
+    "wraplength": 760,
+    "justify": "left",
+}
+_HINT_TEXTS = (
+    "RESET always returns to a base value (e.g., 0 or 50). Add your go-to macro values below.",
+    "Optional voice trigger: type the exact phrase you will say to run the macro. "
+    "Voice/Audio Settings live under Options → Voice/Audio Settings.",
+)
+_HEADER_FONT = ("Arial", 8, "bold")
+# (text, width, padx) of the preset list header columns
+_HEADER_COLUMNS = (
+    ("Type", 6, 0),
+    ("Macro value", 10, 5),
+    ("Keybinding", 12, 5),
+    ("Voice trigger phrase", 20, 5),
+)
+
+# Timing probes drive the real input device, so they run one at a time on a
+# single shared daemon worker instead of a new thread per click.
+_probe_workers = DaemonWorkerPool(1, "dc-probe")
+
 
 class ControlTab(tk.Frame):
     """Configuration tab for a single control variable."""
 
+    # Refresh interval of the current value label while the tab is shown
+    MONITOR_INTERVAL_MS = 500
+
     def __init__(self, parent, controller: GenericController, label_name: str, app):
         super().__init__(parent)
         self.app = app
@@ -19,6 +46,8 @@ class ControlTab(tk.Frame):
         self.controller.update_status = self.update_status_label
         self.controller.app = app
         self.preset_rows: List[Dict[str, Any]] = []
+        # Number of non-RESET rows in preset_rows
+        self._macro_row_count = 0
 
         # Scrollable layout
         scroll_frame = ScrollableFrame(self)
@@ -48,12 +77,13 @@ class ControlTab(tk.Frame):
         )
         self.btn_decrease.pack(side="left", expand=True, fill="x", padx=2)
 
-        tk.Button(
+        self.btn_probe = tk.Button(
             keys_frame,
             text="Test custom minimal time",
             command=self.run_bot_timing_probe,
             bg="#f0f8ff"
-        ).pack(side="left", padx=2)
+        )
+        self.btn_probe.pack(side="left", padx=2)
 
         # Current value monitor
         self.lbl_monitor = tk.Label(
@@ -76,53 +106,17 @@ class ControlTab(tk.Frame):
         )
         presets_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
-        tk.Label(
-            presets_frame,
-            text="RESET always returns to a base value (e.g., 0 or 50). Add your go-to macro values below.",
-            fg="gray",
-            font=("Arial", 8),
-            wraplength=760,
-            justify="left"
-        ).pack(anchor="w", pady=(0, 5))
-
-        tk.Label(
-            presets_frame,
-            text=(
-                "Optional voice trigger: type the exact phrase you will say to run the macro. "
-                "Voice/Audio Settings live under Options → Voice/Audio Settings."
-            ),
-            fg="gray",
-            font=("Arial", 8),
-            wraplength=760,
-            justify="left"
-        ).pack(anchor="w", padx=2, pady=(0, 5))
+        for padx, text in zip((0, 2), _HINT_TEXTS):
+            tk.Label(presets_frame, text=text, **_HINT_LABEL_OPTIONS).pack(
+                anchor="w", padx=padx, pady=(0, 5)
+            )
 
         header = tk.Frame(presets_frame)
         header.pack(fill="x", padx=2, pady=(0, 2))
-        tk.Label(
-            header, text="Type", width=6, anchor="w", font=("Arial", 8, "bold")
-        ).pack(side="left")
-        tk.Label(
-            header,
-            text="Macro value",
-            width=10,
-            anchor="w",
-            font=("Arial", 8, "bold")
-        ).pack(side="left", padx=5)
-        tk.Label(
-            header,
-            text="Keybinding",
-            width=12,
-            anchor="w",
-            font=("Arial", 8, "bold")
-        ).pack(side="left", padx=5)
-        tk.Label(
-            header,
-            text="Voice trigger phrase",
-            width=20,
-            anchor="w",
-            font=("Arial", 8, "bold")
-        ).pack(side="left", padx=5)
+        for text, width, padx in _HEADER_COLUMNS:
+            tk.Label(
+                header, text=text, width=width, anchor="w", font=_HEADER_FONT
+            ).pack(side="left", padx=padx)
 
         self.presets_container = tk.Frame(presets_frame)
         self.presets_container.pack(fill="both", expand=True)
@@ -132,9 +126,22 @@ class ControlTab(tk.Frame):
         for _ in range(4):
             self.add_preset_row()
 
-        # Start monitoring loop
+        # Monitor the value only while this tab is mapped, i.e. the selected
+        # notebook page; <Map> restarts the loop when the tab is shown again.
         self.running = True
-        self.after(500, self.monitor_loop)
+        self._monitor_after: Optional[str] = None
+        self._monitor_text = ""
+        self.bind("<Map>", self._on_map)
+        self.bind("<Unmap>", self._on_unmap)
+
+    def _on_map(self, _event=None):
+        if self._monitor_after is None:
+            self.monitor_loop()
+
+    def _on_unmap(self, _event=None):
+        if self._monitor_after is not None:
+            self.after_cancel(self._monitor_after)
+            self._monitor_after = None
 
     def update_status_label(self, text: str, color: str):
         """Update status label."""
@@ -144,33 +151,52 @@ class ControlTab(tk.Frame):
     def run_bot_timing_probe(self):
         """Run a fast timing probe to suggest a stable BOT delay."""
 
-        def _worker():
-            try:
-                suggested = self.controller.find_minimum_effective_timing()
-            except ValueError as exc:
-                error_msg = str(exc)
-                self.after(
-                    0,
-                    lambda msg=error_msg: messagebox.showerror("Keys Missing", msg)
-                )
-                return
+        # Disabled until the probe finishes so repeated clicks do not queue up
+        self.btn_probe.config(state="disabled")
+        _probe_workers.submit(self._run_probe)
 
-            if suggested is None:
-                self.after(
-                    0,
-                    lambda: messagebox.showwarning(
-                        "Probe Result",
-                        "No timing within 1-120 ms reliably updated telemetry."
-                    )
-                )
-            else:
-                msg = (
-                    f"Minimal stable pulse detected at ~{suggested} ms.\n"
-                    "Apply this value to BOT/custom timings for reliable updates."
-                )
-                self.after(0, lambda: messagebox.showinfo("Probe Result", msg))
+    def _run_probe(self):
+        """Worker side of the timing probe; hands the outcome to the Tk thread."""
+
+        suggested: Optional[int] = None
+        error: Optional[Exception] = None
+        try:
+            suggested = self.controller.find_minimum_effective_timing()
+        except Exception as exc:
+            error = exc
+
+        try:
+            self.after(0, self._probe_done, suggested, error)
+        except (RuntimeError, tk.TclError):
+            # Tab destroyed (or app closing) while the probe was running
+            pass
 
-        threading.Thread(target=_worker, daemon=True).start()
+    def _probe_done(self, suggested: Optional[int], error: Optional[Exception]):
+        """Report a finished timing probe on the Tk thread."""
+
+        try:
+            self.btn_probe.config(state="normal")
+        except tk.TclError:
+            return
+
+        if isinstance(error, ValueError):
+            messagebox.showerror("Keys Missing", str(error))
+            return
+        if error is not None:
+            print(f"[ControlTab] Timing probe failed: {error}")
+            return
+
+        if suggested is None:
+            messagebox.showwarning(
+                "Probe Result",
+                "No timing within 1-120 ms reliably updated telemetry."
+            )
+        else:
+            messagebox.showinfo(
+                "Probe Result",
+                f"Minimal stable pulse detected at ~{suggested} ms.\n"
+                "Apply this value to BOT/custom timings for reliable updates."
+            )
 
     def set_editing_state(self, enabled: bool):
         """Enable/disable editing based on app mode."""
@@ -265,55 +291,46 @@ class ControlTab(tk.Frame):
             fg="red" if is_reset else "black"
         ).pack(side="left")
 
+        existing = existing or {}
+        entry_state = "normal" if self.app.app_state == "CONFIG" else "readonly"
+
+        # Entries get their initial text before the state is set, once.
         value_entry = ttk.Entry(frame, width=8)
         value_entry.pack(side="left", padx=5)
-
-        if self.app.app_state != "CONFIG":
-            value_entry.config(state="readonly")
+        value_entry.insert(0, existing.get("val", ""))
+        value_entry.config(state=entry_state)
 
         bind_button = tk.Button(frame, text="Set Bind", width=12)
         bind_button.pack(side="left", padx=5)
 
         voice_entry = ttk.Entry(frame, width=18)
         voice_entry.pack(side="left", padx=5)
-        voice_entry.insert(0, "")
-        if self.app.app_state != "CONFIG":
-            voice_entry.config(state="readonly")
+        voice_entry.insert(0, existing.get("voice_phrase", ""))
+        voice_entry.config(state=entry_state)
 
         row_data = {
             "frame": frame,
             "entry": value_entry,
-            "bind": None,
+            "bind": existing.get("bind"),
             "is_reset": is_reset,
-            "voice_entry": voice_entry
+            "voice_entry": voice_entry,
+            # Bound once so get_config does not resolve them per save
+            "entry_get": value_entry.get,
+            "voice_get": voice_entry.get,
         }
         self._config_bind_button(bind_button, row_data)
 
-        if existing:
-            value_entry.config(state="normal")
-            value_entry.delete(0, tk.END)
-            value_entry.insert(0, existing.get("val", ""))
-            if self.app.app_state != "CONFIG":
-                value_entry.config(state="readonly")
-
-            row_data["bind"] = existing.get("bind")
-            if row_data["bind"]:
-                bg_color = (
-                    "#90ee90" if "JOY" in row_data["bind"] else "#ADD8E6"
-                )
-                bind_button.config(text=row_data["bind"], bg=bg_color)
-
-            voice_text = existing.get("voice_phrase", "")
-            voice_entry.config(state="normal")
-            voice_entry.delete(0, tk.END)
-            voice_entry.insert(0, voice_text)
-            if self.app.app_state != "CONFIG":
-                voice_entry.config(state="readonly")
+        if row_data["bind"]:
+            bg_color = "#90ee90" if "JOY" in row_data["bind"] else "#ADD8E6"
+            bind_button.config(text=row_data["bind"], bg=bg_color)
 
         self.preset_rows.append(row_data)
+        if not is_reset:
+            self._macro_row_count += 1
 
     def monitor_loop(self):
-        """Background loop to monitor current value."""
+        """Refresh the current value label while the tab is visible."""
+        self._monitor_after = None
         if not self.running:
             return
 
@@ -322,13 +339,14 @@ class ControlTab(tk.Frame):
             text = "--"
         else:
             text = f"{value:.3f}" if self.controller.is_float else str(value)
-        try:
-            self.lbl_monitor.config(text=f"Current: {text}")
-        except Exception:
-            pass
+        if text != self._monitor_text:
+            self._monitor_text = text
+            try:
+                self.lbl_monitor.config(text=f"Current: {text}")
+            except Exception:
+                pass
 
-        if self.running:
-            self.after(500, self.monitor_loop)
+        self._monitor_after = self.after(self.MONITOR_INTERVAL_MS, self.monitor_loop)
 
     def get_config(self) -> Dict[str, Any]:
         """Get current configuration."""
@@ -341,12 +359,10 @@ class ControlTab(tk.Frame):
             "key_decrease_text": self.btn_decrease["text"],
             "presets": [
                 {
-                    "val": row["entry"].get(),
+                    "val": row["entry_get"](),
                     "bind": row["bind"],
-                    "is_reset": row.get("is_reset", False),
-                    "voice_phrase": (
-                        row.get("voice_entry").get() if row.get("voice_entry") else ""
-                    )
+                    "is_reset": row["is_reset"],
+                    "voice_phrase": row["voice_get"](),
                 }
                 for row in self.preset_rows
             ]
@@ -355,6 +371,9 @@ class ControlTab(tk.Frame):
     def destroy(self):  # type: ignore[override]
         """Ensure monitoring loop stops when widget is destroyed."""
         self.running = False
+        if self._monitor_after is not None:
+            self.after_cancel(self._monitor_after)
+            self._monitor_after = None
         super().destroy()
 
     def set_config(self, config: Dict[str, Any]):
@@ -375,22 +394,28 @@ class ControlTab(tk.Frame):
         self.btn_increase.config(text=config.get("key_increase_text", "Set Increase (+)"))
         self.btn_decrease.config(text=config.get("key_decrease_text", "Set Decrease (-)"))
 
-        # Clear and rebuild preset rows
-        for row in list(self.preset_rows):
-            row["frame"].destroy()
-        self.preset_rows.clear()
+        # Clear and rebuild preset rows while the container is unmanaged, so
+        # the layout is recomputed once when it is packed back.
+        self.presets_container.pack_forget()
+        try:
+            for row in list(self.preset_rows):
+                row["frame"].destroy()
+            self.preset_rows.clear()
+            self._macro_row_count = 0
 
-        saved_presets = config.get("presets", [])
-        has_reset = any(p.get("is_reset") for p in saved_presets)
+            saved_presets = config.get("presets", [])
+            has_reset = any(p.get("is_reset") for p in saved_presets)
 
-        if not has_reset:
-            self.add_preset_row(is_reset=True)
+            if not has_reset:
+                self.add_preset_row(is_reset=True)
 
-        for preset in saved_presets:
-            self.add_preset_row(
-                existing=preset,
-                is_reset=preset.get("is_reset", False)
-            )
+            for preset in saved_presets:
+                self.add_preset_row(
+                    existing=preset,
+                    is_reset=preset.get("is_reset", False)
+                )
 
-        while sum(1 for p in self.preset_rows if not p["is_reset"]) < 4:
-            self.add_preset_row()
+            while self._macro_row_count < 4:
+                self.add_preset_row()
+        finally:
+            self.presets_container.pack(fill="both", expand=True)
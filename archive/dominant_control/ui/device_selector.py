@@ -34,22 +34,18 @@ class DeviceSelector(tk.Toplevel):
 
         self.check_vars: Dict[str, tk.BooleanVar] = {}
         all_devices = input_manager.get_all_devices()
+        # First run (nothing allowed yet) defaults to nothing selected
+        allowed = set(current_allowed or ())
 
-        for idx, name in all_devices:
-            var = tk.BooleanVar()
-            if current_allowed:
-                var.set(name in current_allowed)
-            else:
-                # First run defaults to nothing selected
-                var.set(False)
-
-            chk = tk.Checkbutton(
+        self.frame_list.columnconfigure(0, weight=1)
+        for row, (_idx, name) in enumerate(all_devices):
+            var = tk.BooleanVar(self, value=name in allowed)
+            tk.Checkbutton(
                 self.frame_list,
                 text=name,
                 variable=var,
                 anchor="w",
-            )
-            chk.pack(fill="x")
+            ).grid(row=row, column=0, sticky="ew")
             self.check_vars[name] = var
 
         tk.Button(
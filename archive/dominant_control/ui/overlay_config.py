@@ -1,49 +1,23 @@
 """UI components for configuring the HUD overlay."""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import tkinter as tk
 from tkinter import colorchooser
 
 from dominant_control.config import DEFAULT_OVERLAY_FEEDBACK
+from .widgets import ScrollableFrame
 
-
-class ScrollableFrame(tk.Frame):
-    """
-    Frame with vertical scrollbar.
-    Use self.inner as the container for child widgets.
-    """
-
-    def __init__(self, parent, *args, **kwargs):
-        super().__init__(parent, *args, **kwargs)
-
-        canvas = tk.Canvas(self, borderwidth=0, highlightthickness=0)
-        scrollbar = tk.Scrollbar(self, orient="vertical", command=canvas.yview)
-        self.inner = tk.Frame(canvas)
-
-        self.inner.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=self.inner, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        # Mouse wheel support (bind only while hovered)
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        def _bind_mousewheel(_event):
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
-        def _unbind_mousewheel(_event):
-            canvas.unbind_all("<MouseWheel>")
-
-        canvas.bind("<Enter>", _bind_mousewheel)
-        canvas.bind("<Leave>", _unbind_mousewheel)
+# Per-car assist feedback thresholds: (DEFAULT_OVERLAY_FEEDBACK key, label)
+_FEEDBACK_FIELDS = (
+    ("abs_hold_s", "ABS active longer than (s)"),
+    ("tc_hold_s", "TC active longer than (s)"),
+    ("wheelspin_slip", "Wheelspin slip (ratio)"),
+    ("wheelspin_hold_s", "Wheelspin duration (s)"),
+    ("lockup_slip", "Lock-up slip (negative value)"),
+    ("lockup_hold_s", "Lock-up duration (s)"),
+    ("cooldown_s", "Cooldown between alerts (s)"),
+)
 
 
 class OverlayConfigTab(tk.Frame):
@@ -51,10 +25,28 @@ class OverlayConfigTab(tk.Frame):
     Configuration tab for HUD overlay appearance and variable display.
     """
 
+    # Delay before keystroke-driven edits are committed
+    CHANGE_DEBOUNCE_MS = 150
+    # Window in which HUD rebuild requests are coalesced into one
+    REBUILD_COALESCE_MS = 50
+
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
         self.var_rows: Dict[str, Dict[str, Any]] = {}
+        # Variable row widgets, reused across load_for_car calls
+        self._row_pool: List[Dict[str, Any]] = []
+        self._packed_rows = 0
+        # Tcl variable / widget name -> pooled row, for the shared handlers
+        self._row_lookup: Dict[str, Dict[str, Any]] = {}
+        self._loading_rows = False
+        # Pending debounced commits: (Tk after id, car the edit belongs to)
+        self._row_change_after: Dict[str, Tuple[str, str]] = {}
+        self._feedback_after: Optional[Tuple[str, str]] = None
+        # Coalesced HUD rebuild: latest config, timer id, save requested
+        self._rebuild_cfg: Optional[Dict[str, Dict[str, Any]]] = None
+        self._rebuild_after: Optional[str] = None
+        self._rebuild_save = False
 
         # Scrollable layout
         scroll_frame = ScrollableFrame(self)
@@ -143,39 +135,19 @@ class OverlayConfigTab(tk.Frame):
             command=self._on_feedback_toggle,
         ).grid(row=0, column=0, columnspan=2, sticky="w", padx=5, pady=(4, 6))
 
-        self.feedback_vars = {
-            "abs_hold_s": tk.DoubleVar(value=DEFAULT_OVERLAY_FEEDBACK["abs_hold_s"]),
-            "tc_hold_s": tk.DoubleVar(value=DEFAULT_OVERLAY_FEEDBACK["tc_hold_s"]),
-            "wheelspin_slip": tk.DoubleVar(
-                value=DEFAULT_OVERLAY_FEEDBACK["wheelspin_slip"]
-            ),
-            "wheelspin_hold_s": tk.DoubleVar(
-                value=DEFAULT_OVERLAY_FEEDBACK["wheelspin_hold_s"]
-            ),
-            "lockup_slip": tk.DoubleVar(value=DEFAULT_OVERLAY_FEEDBACK["lockup_slip"]),
-            "lockup_hold_s": tk.DoubleVar(value=DEFAULT_OVERLAY_FEEDBACK["lockup_hold_s"]),
-            "cooldown_s": tk.DoubleVar(value=DEFAULT_OVERLAY_FEEDBACK["cooldown_s"]),
-        }
+        self.feedback_vars: Dict[str, tk.DoubleVar] = {}
         self.feedback_entries: Dict[str, tk.Entry] = {}
 
-        feedback_rows = [
-            ("ABS active longer than (s)", "abs_hold_s"),
-            ("TC active longer than (s)", "tc_hold_s"),
-            ("Wheelspin slip (ratio)", "wheelspin_slip"),
-            ("Wheelspin duration (s)", "wheelspin_hold_s"),
-            ("Lock-up slip (negative value)", "lockup_slip"),
-            ("Lock-up duration (s)", "lockup_hold_s"),
-            ("Cooldown between alerts (s)", "cooldown_s"),
-        ]
-
-        for idx, (label, key) in enumerate(feedback_rows, start=1):
+        for idx, (key, label) in enumerate(_FEEDBACK_FIELDS, start=1):
+            var = tk.DoubleVar(self, value=DEFAULT_OVERLAY_FEEDBACK[key])
             tk.Label(feedback_frame, text=label).grid(
                 row=idx, column=0, padx=5, pady=2, sticky="w"
             )
-            entry = tk.Entry(feedback_frame, width=10, textvariable=self.feedback_vars[key])
+            entry = tk.Entry(feedback_frame, width=10, textvariable=var)
             entry.grid(row=idx, column=1, padx=5, pady=2, sticky="w")
-            entry.bind("<FocusOut>", self._on_feedback_change)
+            entry.bind("<FocusOut>", self._commit_feedback_now)
             entry.bind("<KeyRelease>", self._on_feedback_change)
+            self.feedback_vars[key] = var
             self.feedback_entries[key] = entry
 
         self._set_feedback_fields_enabled(self.app.show_overlay_feedback.get())
@@ -236,10 +208,11 @@ class OverlayConfigTab(tk.Frame):
 
     def apply_style(self):
         """Apply current style settings to overlay."""
-        self.app.overlay.style_cfg["font_size"] = int(self.scale_font.get())
-        self.app.overlay.style_cfg["opacity"] = float(self.scale_opacity.get())
-        self.app.overlay.apply_style(self.app.overlay.style_cfg)
-        self.app.save_config()
+        style_cfg = self.app.overlay.style_cfg
+        style_cfg["font_size"] = int(self.scale_font.get())
+        style_cfg["opacity"] = float(self.scale_opacity.get())
+        self.app.overlay.apply_style(style_cfg)
+        self.app.schedule_save()
 
     def load_for_car(
         self,
@@ -255,11 +228,9 @@ class OverlayConfigTab(tk.Frame):
             var_list: List of (var_name, is_float) tuples
             overlay_config: Dict of var_name -> {"show": bool, "label": str}
         """
+        self._flush_pending_changes()
         self._load_feedback_for_car(car_name)
 
-        # Rebuild variable rows
-        for child in self.variables_list_frame.winfo_children():
-            child.destroy()
         self.var_rows.clear()
 
         # Ensure all variables have config entries
@@ -270,55 +241,129 @@ class OverlayConfigTab(tk.Frame):
                     "label": var_name.replace("dc", "")
                 }
 
-        # Create UI rows
-        for var_name, _is_float in var_list:
-            config = overlay_config.get(var_name, {})
+        # Reuse pooled rows; reconfiguring them must not look like user edits.
+        # Rows are packed in pool order, so the first _packed_rows are already
+        # in place and only fields that differ are rewritten.
+        self._loading_rows = True
+        try:
+            for index, (var_name, _is_float) in enumerate(var_list):
+                config = overlay_config.get(var_name, {})
+                row = self._acquire_row(index)
+                if row["var_name"] != var_name:
+                    row["var_name"] = var_name
+                    row["short_name"] = var_name.replace("dc", "")
+                    row["name_label"].config(text=var_name)
+                show = bool(config.get("show", False))
+                if row["show_var"].get() != show:
+                    row["show_var"].set(show)
+                label = config.get("label") or row["short_name"]
+                entry = row["entry"]
+                if entry.get() != label:
+                    entry.delete(0, tk.END)
+                    entry.insert(0, label)
+                if index >= self._packed_rows:
+                    row["frame"].pack(fill="x", pady=2)
+                self.var_rows[var_name] = row
+
+            for row in self._row_pool[len(var_list):self._packed_rows]:
+                row["var_name"] = ""
+                row["frame"].pack_forget()
+            self._packed_rows = len(var_list)
+        finally:
+            self._loading_rows = False
 
-            row = tk.Frame(self.variables_list_frame)
-            row.pack(fill="x", pady=2)
+        self.app.preset_manager.car_overlay_config[car_name] = overlay_config
+        self._collect_feedback_for_car(car_name)
+        self._schedule_rebuild(overlay_config)
+        self.app.schedule_save()
 
-            show_var = tk.BooleanVar(value=config.get("show", False))
-            checkbox = tk.Checkbutton(row, variable=show_var)
-            checkbox.pack(side="left", padx=2)
+    def _acquire_row(self, index: int) -> Dict[str, Any]:
+        """Return the pooled variable row at ``index``, creating it if needed."""
 
-            tk.Label(row, text=var_name, width=25, anchor="w").pack(
-                side="left", padx=2
-            )
+        if index < len(self._row_pool):
+            return self._row_pool[index]
 
-            label_entry = tk.Entry(row, width=20)
-            label_entry.pack(side="left", padx=2)
-            label_entry.insert(
-                0,
-                config.get("label") or var_name.replace("dc", "")
-            )
+        frame = tk.Frame(self.variables_list_frame)
+        show_var = tk.BooleanVar(value=False)
+        checkbox = tk.Checkbutton(frame, variable=show_var)
+        checkbox.pack(side="left", padx=2)
 
-            self.var_rows[var_name] = {
-                "show_var": show_var,
-                "entry": label_entry
-            }
+        name_label = tk.Label(frame, width=25, anchor="w")
+        name_label.pack(side="left", padx=2)
 
-            show_var.trace_add(
-                "write",
-                lambda *_args, vn=var_name: self._on_overlay_row_change(vn)
-            )
-            label_entry.bind(
-                "<KeyRelease>",
-                lambda _event, vn=var_name: self._on_overlay_row_change(vn)
-            )
+        label_entry = tk.Entry(frame, width=20)
+        label_entry.pack(side="left", padx=2)
 
-        self.app.preset_manager.car_overlay_config[car_name] = overlay_config
-        self._collect_feedback_for_car(car_name)
-        self.app.overlay.rebuild_monitor(overlay_config)
-        self.app.save_config()
+        row: Dict[str, Any] = {
+            "frame": frame,
+            "checkbox": checkbox,
+            "name_label": name_label,
+            "entry": label_entry,
+            "show_var": show_var,
+            "var_name": "",
+            "short_name": "",
+        }
+
+        # Bound once per pooled row to shared handlers that find the row by
+        # its Tcl name, so reloads neither stack callbacks nor add closures.
+        row["trace_id"] = show_var.trace_add("write", self._on_row_show_write)
+        label_entry.bind("<KeyRelease>", self._on_row_entry_key)
+        self._row_lookup[str(show_var)] = row
+        self._row_lookup[str(label_entry)] = row
+
+        self._row_pool.append(row)
+        return row
+
+    def _on_row_show_write(self, tcl_var: str, *_args) -> None:
+        row = self._row_lookup.get(tcl_var)
+        if row is not None:
+            self._on_overlay_row_change(row["var_name"])
+
+    def _on_row_entry_key(self, event) -> None:
+        row = self._row_lookup.get(str(event.widget))
+        if row is not None:
+            self._on_overlay_row_change(row["var_name"])
 
     def _on_feedback_change(self, *_args):
-        """Persist feedback edits and save lazily."""
+        """Debounce feedback edits so a burst of keystrokes commits once."""
 
+        if self._feedback_after:
+            self.after_cancel(self._feedback_after[0])
         car = self.app.current_car or "Generic Car"
+        after_id = self.after(
+            self.CHANGE_DEBOUNCE_MS, self._commit_feedback_change, car
+        )
+        self._feedback_after = (after_id, car)
+
+    def _commit_feedback_change(self, car: str):
+        """Persist feedback edits and save lazily."""
+
+        self._feedback_after = None
         self._collect_feedback_for_car(car)
         self.app.schedule_save()
         self.app.sync_overlay_manager()
 
+    def _commit_feedback_now(self, *_args):
+        """Commit feedback edits immediately, e.g. when an entry loses focus."""
+
+        if self._feedback_after:
+            after_id, car = self._feedback_after
+            self.after_cancel(after_id)
+        else:
+            car = self.app.current_car or "Generic Car"
+        self._commit_feedback_change(car)
+
+    def _flush_pending_changes(self) -> None:
+        """Commit debounced edits immediately, e.g. before switching cars."""
+
+        for var_name, (after_id, car) in list(self._row_change_after.items()):
+            self.after_cancel(after_id)
+            self._commit_overlay_row_change(var_name, car)
+        if self._feedback_after:
+            after_id, car = self._feedback_after
+            self.after_cancel(after_id)
+            self._commit_feedback_change(car)
+
     def _on_feedback_toggle(self):
         """Enable or disable assist hints and persist the preference."""
 
@@ -336,19 +381,30 @@ class OverlayConfigTab(tk.Frame):
                 continue
 
     def _on_overlay_row_change(self, var_name: str):
-        """Apply live updates when overlay rows change."""
+        """Debounce overlay row edits so typing a label rebuilds the HUD once."""
+        if self._loading_rows or not var_name:
+            return
+        prev = self._row_change_after.pop(var_name, None)
+        if prev:
+            self.after_cancel(prev[0])
         car = self.app.current_car or "Generic Car"
-        config = self.app.preset_manager.car_overlay_config.get(car, {})
+        after_id = self.after(
+            self.CHANGE_DEBOUNCE_MS, self._commit_overlay_row_change, var_name, car
+        )
+        self._row_change_after[var_name] = (after_id, car)
+
+    def _commit_overlay_row_change(self, var_name: str, car: str):
+        """Apply live updates when overlay rows change."""
+        self._row_change_after.pop(var_name, None)
         row = self.var_rows.get(var_name)
         if not row:
             return
 
-        show = row["show_var"].get()
-        label = row["entry"].get().strip() or var_name.replace("dc", "")
-        config[var_name] = {"show": show, "label": label}
-        self.app.preset_manager.car_overlay_config[car] = config
-        self.app.overlay.rebuild_monitor(config)
-        self.app.schedule_save()
+        config = self.app.preset_manager.car_overlay_config.setdefault(car, {})
+        var_cfg = config.setdefault(var_name, {})
+        var_cfg["show"] = row["show_var"].get()
+        var_cfg["label"] = row["entry"].get().strip() or row["short_name"]
+        self._schedule_rebuild(config, save=True)
 
     def collect_for_car(self, car_name: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -360,18 +416,39 @@ class OverlayConfigTab(tk.Frame):
         Returns:
             Dict of var_name -> {"show": bool, "label": str}
         """
-        config = self.app.preset_manager.car_overlay_config.get(car_name, {})
+        config = self.app.preset_manager.car_overlay_config.setdefault(car_name, {})
 
+        # Entries are updated in place rather than rebuilt per row
         for var_name, row_config in self.var_rows.items():
-            show = row_config["show_var"].get()
-            label = row_config["entry"].get().strip() or var_name.replace("dc", "")
-            config[var_name] = {"show": show, "label": label}
-
-        self.app.preset_manager.car_overlay_config[car_name] = config
+            var_cfg = config.setdefault(var_name, {})
+            var_cfg["show"] = row_config["show_var"].get()
+            var_cfg["label"] = row_config["entry"].get().strip() or row_config["short_name"]
         self._collect_feedback_for_car(car_name)
-        self.app.overlay.rebuild_monitor(config)
+        # No save here: this runs while a save is being built
+        self._schedule_rebuild(config)
         return config
 
+    def _schedule_rebuild(
+        self, config: Dict[str, Dict[str, Any]], save: bool = False
+    ) -> None:
+        """Rebuild the HUD once for a burst of requests, using the latest config."""
+
+        self._rebuild_cfg = config
+        self._rebuild_save = self._rebuild_save or save
+        if self._rebuild_after is None:
+            self._rebuild_after = self.after(
+                self.REBUILD_COALESCE_MS, self._flush_rebuild
+            )
+
+    def _flush_rebuild(self) -> None:
+        config, self._rebuild_cfg = self._rebuild_cfg, None
+        save, self._rebuild_save = self._rebuild_save, False
+        self._rebuild_after = None
+        if config is not None:
+            self.app.overlay.rebuild_monitor(config)
+        if save:
+            self.app.schedule_save()
+
     def _load_feedback_for_car(self, car_name: str) -> None:
         """Load per-car feedback thresholds into the UI fields."""
 
@@ -390,9 +467,10 @@ class OverlayConfigTab(tk.Frame):
         """Persist feedback thresholds from UI fields for a car."""
 
         cfg: Dict[str, float] = DEFAULT_OVERLAY_FEEDBACK.copy()
-        for key, var in self.feedback_vars.items():
+        # Parse the entry text directly; DoubleVar.get would reparse it in Tcl
+        for key, entry in self.feedback_entries.items():
             try:
-                cfg[key] = float(var.get())
+                cfg[key] = float(entry.get())
             except Exception:
                 cfg[key] = DEFAULT_OVERLAY_FEEDBACK[key]
 
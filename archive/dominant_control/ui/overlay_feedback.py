@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import numbers
 import time
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import irsdk
 
@@ -14,33 +13,85 @@ from dominant_control.config import DEFAULT_OVERLAY_FEEDBACK
 class OverlayFeedbackManager:
     """Encapsulates overlay feedback state and telemetry access."""
 
+    __slots__ = (
+        "ir",
+        "_notify",
+        "last_time",
+        "_counters",
+        "last_alert",
+        "last_alert_time",
+        "_cfg_cache",
+    )
+
+    _ABS_KEYS = (
+        "BrakeABSactive",
+        "BrakeABSActive",
+        "BrakeABSActiveLF",
+        "BrakeABSActiveRF",
+        "BrakeABSActiveLR",
+        "BrakeABSActiveRR",
+    )
+    _TC_KEYS = (
+        "TractionControlActive",
+        "TractionControlEngaged",
+        "TCActive",
+        "TractionControlOn",
+    )
+    _SLIP_KEYS = ("WheelSlip", "WheelSlipPct", "WheelSlipRatio", "TireSlip")
+    _SNAPSHOT_KEYS = ("Throttle", "Brake") + _ABS_KEYS + _TC_KEYS + _SLIP_KEYS
+
+    # (hold threshold key, message, color) per counter: ABS, TC, spin, lock-up
+    _ALERTS = (
+        (
+            "abs_hold_s",
+            "ABS active too long: ease off the brake or lower ABS.",
+            "orange",
+        ),
+        (
+            "tc_hold_s",
+            "TC constantly triggering: consider lowering TC or changing the map.",
+            "orange",
+        ),
+        (
+            "wheelspin_hold_s",
+            "Wheelspin detected: raise TC or modulate the throttle.",
+            "orange",
+        ),
+        (
+            "lockup_hold_s",
+            "Lock-up detected: increase ABS or ease pedal pressure.",
+            "orange",
+        ),
+    )
+
     def __init__(self, ir: irsdk.IRSDK, notifier: Callable[[str, str], None]):
         self.ir = ir
         self._notify = notifier
-        self._state = {
-            "last_time": time.time(),
-            "abs_active": 0.0,
-            "tc_active": 0.0,
-            "spin_active": 0.0,
-            "lock_active": 0.0,
-            "last_alert": "",
-            "last_alert_time": 0.0,
-        }
+        self.last_time = time.time()
+        # Seconds each assist condition has been active, indexed like _ALERTS
+        self._counters = [0.0] * len(self._ALERTS)
+        self.last_alert = ""
+        self.last_alert_time = 0.0
+        # (car, per-car override dict, merged cfg, cooldown) from the last tick
+        self._cfg_cache: Tuple[str, Any, Dict[str, Any], float] = ("", None, {}, 0.0)
 
     def set_ir(self, ir: irsdk.IRSDK) -> None:
         """Update the IRSDK handle used for telemetry reads."""
 
         self.ir = ir
 
-    def _read_ir_value(self, key: str):
-        """Safely read a telemetry key from the iRacing SDK."""
+    def _snapshot(self, keys: Tuple[str, ...]) -> Dict[str, Any]:
+        """Read all requested telemetry keys with a single guarded SDK poll."""
 
+        ir = self.ir
+        # Broad guard: a half-connected SDK can raise OSError, mmap, struct or
+        # YAML errors, and any escape would stop the HUD update loop.
         try:
-            if not getattr(self.ir, "is_initialized", False):
-                self.ir.startup()
-            return self.ir[key]
+            if not ir.is_initialized and not ir.startup():
+                return {}
+            return {key: ir[key] for key in keys}
         except Exception:
-            return None
+            return {}
 
     @staticmethod
     def _safe_float(value: Any, default: float = 0.0) -> float:
@@ -49,50 +100,80 @@ class OverlayFeedbackManager:
         except Exception:
             return default
 
-    def _bool_from_keys(self, keys: List[str]) -> bool:
+    @staticmethod
+    def _bool_from_keys(snapshot: Dict[str, Any], keys: Tuple[str, ...]) -> bool:
         """Return True if any telemetry key resolves to a truthy value."""
 
         for key in keys:
-            value = self._read_ir_value(key)
+            value = snapshot.get(key)
+            value_type = type(value)
 
-            if isinstance(value, (list, tuple)):
-                if any(bool(v) for v in value):
+            if value_type is list or value_type is tuple:
+                if any(value):
                     return True
-            elif isinstance(value, numbers.Real):
-                if float(value) != 0.0:
+            elif value_type is bool or value_type is int or value_type is float:
+                if value:
                     return True
-            elif isinstance(value, bool) and value:
-                return True
 
         return False
 
-    def _slip_values(self) -> List[float]:
-        """Aggregate slip ratios from available telemetry fields."""
-
-        slips: List[float] = []
-        for key in ["WheelSlip", "WheelSlipPct", "WheelSlipRatio", "TireSlip"]:
-            value = self._read_ir_value(key)
-            if isinstance(value, (list, tuple)):
-                slips.extend([self._safe_float(v, 0.0) for v in value])
-
-        return slips
+    def _slip_range(self, snapshot: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+        """Return (max, min) slip across available telemetry fields, if any."""
+
+        max_slip: Optional[float] = None
+        min_slip = 0.0
+        for key in self._SLIP_KEYS:
+            value = snapshot.get(key)
+            if not isinstance(value, (list, tuple)) or not value:
+                continue
+            try:
+                values = list(map(float, value))
+            except (TypeError, ValueError):
+                values = [self._safe_float(v, 0.0) for v in value]
+            hi = max(values)
+            lo = min(values)
+            if max_slip is None:
+                max_slip, min_slip = hi, lo
+            else:
+                max_slip = max(max_slip, hi)
+                min_slip = min(min_slip, lo)
+
+        if max_slip is None:
+            return None
+        return max_slip, min_slip
 
     def _push_overlay_alert(
-        self, message: str, color: str, cfg: Dict[str, float], now: float
+        self, message: str, color: str, cooldown: float, now: float
     ) -> None:
         """Send rate-limited feedback to the overlay status area."""
 
-        cooldown = max(0.5, float(cfg.get("cooldown_s", 6.0)))
-
-        if (
-            now - self._state.get("last_alert_time", 0.0) < cooldown
-            and self._state.get("last_alert") == message
-        ):
+        if now - self.last_alert_time < cooldown and self.last_alert == message:
             return
 
         self._notify(message, color)
-        self._state["last_alert"] = message
-        self._state["last_alert_time"] = now
+        self.last_alert = message
+        self.last_alert_time = now
+
+    def _feedback_config(
+        self, current_car: str, car_overlay_feedback: Dict[str, Dict[str, float]]
+    ) -> Tuple[Dict[str, Any], float]:
+        """Return the merged thresholds and alert cooldown for the car.
+
+        The merge is reused while the car's override dict is the same object;
+        edits in the config tab replace that dict, which refreshes the cache.
+        """
+
+        car = current_car or "Generic Car"
+        override = car_overlay_feedback.get(car)
+        cached_car, cached_override, cfg, cooldown = self._cfg_cache
+        if car == cached_car and override is cached_override and cfg:
+            return cfg, cooldown
+
+        cfg = DEFAULT_OVERLAY_FEEDBACK.copy()
+        cfg.update(override or {})
+        cooldown = max(0.5, float(cfg.get("cooldown_s", 6.0)))
+        self._cfg_cache = (car, override, cfg, cooldown)
+        return cfg, cooldown
 
     def update_feedback(
         self,
@@ -103,97 +184,39 @@ class OverlayFeedbackManager:
         """Analyze telemetry and surface ABS/TC/wheelspin hints on the HUD."""
 
         if not enabled:
-            self._state["last_time"] = time.time()
+            self.last_time = time.time()
             return
 
-        car = current_car or "Generic Car"
-        cfg = DEFAULT_OVERLAY_FEEDBACK.copy()
-        cfg.update(car_overlay_feedback.get(car, {}))
+        cfg, cooldown = self._feedback_config(current_car, car_overlay_feedback)
 
         now = time.time()
-        dt = max(0.0, now - self._state.get("last_time", now))
-        self._state["last_time"] = now
-
-        throttle = self._safe_float(self._read_ir_value("Throttle"), 0.0)
-        brake = self._safe_float(self._read_ir_value("Brake"), 0.0)
-
-        abs_active = self._bool_from_keys(
-            [
-                "BrakeABSactive",
-                "BrakeABSActive",
-                "BrakeABSActiveLF",
-                "BrakeABSActiveRF",
-                "BrakeABSActiveLR",
-                "BrakeABSActiveRR",
-            ]
-        )
-        tc_active = self._bool_from_keys(
-            [
-                "TractionControlActive",
-                "TractionControlEngaged",
-                "TCActive",
-                "TractionControlOn",
-            ]
-        )
+        dt = max(0.0, now - self.last_time)
+        self.last_time = now
 
-        slips = self._slip_values()
-        max_slip = max(slips) if slips else 0.0
-        min_slip = min(slips) if slips else 0.0
+        snapshot = self._snapshot(self._SNAPSHOT_KEYS)
+        throttle = self._safe_float(snapshot.get("Throttle"), 0.0)
+        brake = self._safe_float(snapshot.get("Brake"), 0.0)
 
-        if abs_active and brake > 0.05:
-            self._state["abs_active"] += dt
-        else:
-            self._state["abs_active"] = 0.0
+        abs_active = self._bool_from_keys(snapshot, self._ABS_KEYS)
+        tc_active = self._bool_from_keys(snapshot, self._TC_KEYS)
 
-        if tc_active and throttle > 0.2:
-            self._state["tc_active"] += dt
-        else:
-            self._state["tc_active"] = 0.0
-
-        if throttle > 0.2 and max_slip >= cfg["wheelspin_slip"]:
-            self._state["spin_active"] += dt
-        else:
-            self._state["spin_active"] = 0.0
+        slip_range = self._slip_range(snapshot)
+        max_slip, min_slip = slip_range or (0.0, 0.0)
 
         lock_threshold = -abs(cfg["lockup_slip"])
-        if brake > 0.05 and slips and min_slip <= lock_threshold:
-            self._state["lock_active"] += dt
-        else:
-            self._state["lock_active"] = 0.0
-
-        if self._state["abs_active"] >= cfg["abs_hold_s"]:
-            self._push_overlay_alert(
-                "ABS active too long: ease off the brake or lower ABS.",
-                "orange",
-                cfg,
-                now,
-            )
-            self._state["abs_active"] = 0.0
-
-        if self._state["tc_active"] >= cfg["tc_hold_s"]:
-            self._push_overlay_alert(
-                "TC constantly triggering: consider lowering TC or changing the map.",
-                "orange",
-                cfg,
-                now,
-            )
-            self._state["tc_active"] = 0.0
-
-        if self._state["spin_active"] >= cfg["wheelspin_hold_s"]:
-            self._push_overlay_alert(
-                "Wheelspin detected: raise TC or modulate the throttle.",
-                "orange",
-                cfg,
-                now,
-            )
-            self._state["spin_active"] = 0.0
-
-        if self._state["lock_active"] >= cfg["lockup_hold_s"]:
-            self._push_overlay_alert(
-                "Lock-up detected: increase ABS or ease pedal pressure.",
-                "orange",
-                cfg,
-                now,
-            )
-            self._state["lock_active"] = 0.0
+        active = (
+            abs_active and brake > 0.05,
+            tc_active and throttle > 0.2,
+            throttle > 0.2 and max_slip >= cfg["wheelspin_slip"],
+            brake > 0.05 and bool(slip_range) and min_slip <= lock_threshold,
+        )
 
+        counters = self._counters
+        for index, (hold_key, message, color) in enumerate(self._ALERTS):
+            if not active[index]:
+                counters[index] = 0.0
+                continue
+            counters[index] += dt
+            if counters[index] >= cfg[hold_key]:
+                self._push_overlay_alert(message, color, cooldown, now)
+                counters[index] = 0.0
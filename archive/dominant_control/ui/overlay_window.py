@@ -1,8 +1,9 @@
 """HUD overlay window implementation."""
 
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import tkinter as tk
+from tkinter import font as tkfont
 
 from dominant_control.config import apply_app_icon
 
@@ -10,6 +11,23 @@ from dominant_control.config import apply_app_icon
 class OverlayWindow(tk.Toplevel):
     """Draggable HUD overlay showing real-time telemetry values."""
 
+    # Named status colors; "white" follows the configured text color
+    STATUS_COLORS = {
+        "red": "#FF4444",
+        "green": "#00FF00",
+        "orange": "#FFA500",
+    }
+
+    # Value formatters keyed by exact telemetry type; other types fall back
+    # to _format_value
+    VALUE_FORMATTERS = {
+        type(None): lambda _value: "--",
+        float: "{:.3f}".format,
+        int: str,
+        bool: str,
+        str: str,
+    }
+
     def __init__(self, parent):
         super().__init__(parent)
         self.overrideredirect(True)
@@ -25,37 +43,73 @@ class OverlayWindow(tk.Toplevel):
             "opacity": 0.85,
         }
 
-        self.configure(bg=self.style_cfg["bg"])
+        # Hot style values mirrored from style_cfg; refreshed in apply_style
+        self._bg = self.style_cfg["bg"]
+        self._fg = self.style_cfg["fg"]
+        self._fs = self.style_cfg["font_size"]
+        self._line_height = self._fs * 2 + 6
+
+        # Shared fonts; reconfiguring them restyles every widget that uses them
+        self._font_status = tkfont.Font(
+            self, family="Consolas", size=self._fs + 1, weight="bold"
+        )
+        self._font_name = tkfont.Font(self, family="Consolas", size=self._fs)
+        self._font_value = tkfont.Font(
+            self, family="Consolas", size=self._fs, weight="bold"
+        )
+
+        self.configure(bg=self._bg)
 
         # Status header
-        self.frame_status = tk.Frame(self, bg=self.style_cfg["bg"])
+        self.frame_status = tk.Frame(self, bg=self._bg)
         self.frame_status.pack(fill="x", pady=2)
 
         self.lbl_status = tk.Label(
             self.frame_status,
             text="HUD Ready",
             fg="#00FF00",
-            bg=self.style_cfg["bg"],
-            font=("Consolas", self.style_cfg["font_size"] + 1, "bold"),
+            bg=self._bg,
+            font=self._font_status,
         )
         self.lbl_status.pack(anchor="w", padx=5)
+        self._last_status: Tuple[str, str] = ("HUD Ready", "#00FF00")
 
         self.separator = tk.Frame(self, bg="#333", height=1)
         self.separator.pack(fill="x", padx=2)
 
         # Content area
-        self.frame_monitor = tk.Frame(self, bg=self.style_cfg["bg"])
+        self.frame_monitor = tk.Frame(self, bg=self._bg)
         self.frame_monitor.pack(fill="both", expand=True, padx=5, pady=2)
 
         self.monitor_widgets: Dict[str, Tuple[tk.Label, tk.Label]] = {}
+        self._last_h: Optional[int] = None
+        self._pos: Tuple[int, int] = (50, 50)
+        self._last_text: Dict[str, str] = {}
+        self._pending_text: Dict[str, str] = {}
+        self._flush_scheduled = False
+
+        # Value updates are skipped while the HUD is withdrawn or minimized
+        self._viewable = True
+        self.bind("<Map>", self._on_map)
+        self.bind("<Unmap>", self._on_unmap)
 
         # Drag support
         self.x = 0
         self.y = 0
+        self._move_after: Optional[str] = None
         self._bind_drag(self.frame_status)
         self._bind_drag(self.lbl_status)
         self._bind_drag(self.frame_monitor)
 
+    def _on_map(self, event):
+        # Toplevel bindings also see child events; only track the window
+        if event.widget is self:
+            self._viewable = True
+
+    def _on_unmap(self, event):
+        if event.widget is self:
+            self._viewable = False
+
     def _bind_drag(self, widget):
         """Bind drag events to a widget."""
         widget.bind("<Button-1>", self._start_move)
@@ -70,8 +124,16 @@ class OverlayWindow(tk.Toplevel):
         """Handle drag motion."""
         dx = event.x - self.x
         dy = event.y - self.y
-        x = self.winfo_x() + dx
-        y = self.winfo_y() + dy
+        self._pos = (self.winfo_x() + dx, self.winfo_y() + dy)
+        # Motion events can outpace the window manager; move once per idle
+        # cycle to the latest position
+        if self._move_after is None:
+            self._move_after = self.after_idle(self._apply_move)
+
+    def _apply_move(self):
+        """Apply the most recent drag position."""
+        self._move_after = None
+        x, y = self._pos
         self.geometry(f"+{x}+{y}")
 
     def apply_style(self, style_dict: Dict[str, Any]):
@@ -82,28 +144,32 @@ class OverlayWindow(tk.Toplevel):
             style_dict: Dictionary with bg, fg, font_size, opacity keys
         """
         self.style_cfg.update(style_dict)
-        bg = self.style_cfg["bg"]
-        fg = self.style_cfg["fg"]
-        fs = self.style_cfg["font_size"]
+        bg = self._bg = self.style_cfg["bg"]
+        fg = self._fg = self.style_cfg["fg"]
+        fs = self._fs = self.style_cfg["font_size"]
         op = self.style_cfg["opacity"]
+        self._line_height = fs * 2 + 6
 
         self.configure(bg=bg)
         self.wm_attributes("-alpha", op)
 
         self.frame_status.config(bg=bg)
-        self.lbl_status.config(bg=bg, font=("Consolas", fs + 1, "bold"))
+        self.lbl_status.config(bg=bg)
         self.frame_monitor.config(bg=bg)
 
-        # Update all monitor widgets
-        for row in self.frame_monitor.winfo_children():
-            row.config(bg=bg)
-            for child in row.winfo_children():
-                txt = child.cget("text")
-                is_value = (txt == "--" or (txt and (txt[0].isdigit() or txt[0] == "-")))
-                if is_value:
-                    child.config(bg=bg, fg=fg, font=("Consolas", fs, "bold"))
-                else:
-                    child.config(bg=bg, fg="#AAAAAA", font=("Consolas", fs))
+        self._font_status.configure(size=fs + 1)
+        self._font_name.configure(size=fs)
+        self._font_value.configure(size=fs)
+
+        # Update all monitor widgets with one Tcl script instead of a
+        # round-trip per widget (colors are brace-quoted for names with spaces)
+        script = []
+        for l_name, l_value in self.monitor_widgets.values():
+            script.append(f"{l_name.master} configure -bg {{{bg}}}")
+            script.append(f"{l_name} configure -bg {{{bg}}} -fg #AAAAAA")
+            script.append(f"{l_value} configure -bg {{{bg}}} -fg {{{fg}}}")
+        if script:
+            self.tk.eval("\n".join(script))
 
     def update_status_text(self, text: str, color: str = "white"):
         """
@@ -113,94 +179,148 @@ class OverlayWindow(tk.Toplevel):
             text: Status text to display
             color: Color name or hex code
         """
-        color_map = {
-            "red": "#FF4444",
-            "green": "#00FF00",
-            "orange": "#FFA500",
-            "white": self.style_cfg["fg"],
-        }
-        c = color_map.get(color, color)
+        if color == "white":
+            c = self._fg
+        else:
+            c = self.STATUS_COLORS.get(color, color)
+        if (text, c) == self._last_status:
+            return
         try:
             self.lbl_status.config(text=text, fg=c)
         except Exception:
-            pass
+            return
+        self._last_status = (text, c)
 
     def rebuild_monitor(self, var_configs: Dict[str, Dict[str, Any]]):
         """
         Rebuild the monitor display with new variables.
 
+        Rows for variables that stay visible are reused; only rows that were
+        hidden are destroyed and only newly shown variables get new widgets.
+
         Args:
             var_configs: Dict of var_name -> {"show": bool, "label": str}
         """
-        # Clear existing widgets
-        for widget in self.frame_monitor.winfo_children():
-            widget.destroy()
-        self.monitor_widgets.clear()
-
         visible_vars = [v for v, cfg in var_configs.items() if cfg.get("show", False)]
+        visible_count = len(visible_vars)
+
+        for var_name in set(self.monitor_widgets) - set(visible_vars):
+            l_name, _l_value = self.monitor_widgets.pop(var_name)
+            l_name.master.destroy()
+            self._last_text.pop(var_name, None)
+            self._pending_text.pop(var_name, None)
+
         if not visible_vars:
             return
 
+        # Unpack retained rows so they can be re-packed in the requested order
+        for l_name, _l_value in self.monitor_widgets.values():
+            l_name.master.pack_forget()
+
         for var_name in visible_vars:
             cfg = var_configs.get(var_name, {})
             label_text = cfg.get("label") or var_name.replace("dc", "")
 
-            row = tk.Frame(self.frame_monitor, bg=self.style_cfg["bg"])
-            row.pack(fill="x")
-            self._bind_drag(row)
-
-            l_name = tk.Label(
-                row,
-                text=f"{label_text}:",
-                bg=self.style_cfg["bg"],
-                fg="#AAAAAA",
-                font=("Consolas", self.style_cfg["font_size"]),
-                width=15,
-                anchor="w",
-            )
-            l_name.pack(side="left")
-            self._bind_drag(l_name)
-
-            l_value = tk.Label(
-                row,
-                text="--",
-                bg=self.style_cfg["bg"],
-                fg=self.style_cfg["fg"],
-                font=("Consolas", self.style_cfg["font_size"], "bold"),
-            )
-            l_value.pack(side="right")
-            self._bind_drag(l_value)
-
-            self.monitor_widgets[var_name] = (l_name, l_value)
+            widgets = self.monitor_widgets.get(var_name)
+            if widgets is None:
+                widgets = self._create_monitor_row(label_text)
+                self.monitor_widgets[var_name] = widgets
+            else:
+                widgets[0].config(text=f"{label_text}:")
+            widgets[0].master.pack(fill="x")
 
         # Resize window
-        line_height = self.style_cfg["font_size"] * 2 + 6
-        h = 45 + (len(visible_vars) * line_height)
+        h = 45 + (visible_count * self._line_height)
         h = max(60, min(h, 800))
+        if h == self._last_h:
+            return
+        self._last_h = h
 
-        geometry = self.geometry().split('+')
-        try:
-            self.geometry(f"250x{h}+{geometry[1]}+{geometry[2]}")
-        except Exception:
-            self.geometry(f"250x{h}+50+50")
+        x, y = self._pos
+        self.geometry(f"250x{h}+{x}+{y}")
+
+    def _create_monitor_row(self, label_text: str) -> Tuple[tk.Label, tk.Label]:
+        """Create an unpacked monitor row and return its (name, value) labels."""
+
+        row = tk.Frame(self.frame_monitor, bg=self._bg)
+        self._bind_drag(row)
+
+        l_name = tk.Label(
+            row,
+            text=f"{label_text}:",
+            bg=self._bg,
+            fg="#AAAAAA",
+            font=self._font_name,
+            width=15,
+            anchor="w",
+        )
+        l_name.pack(side="left")
+        self._bind_drag(l_name)
+
+        l_value = tk.Label(
+            row,
+            text="--",
+            bg=self._bg,
+            fg=self._fg,
+            font=self._font_value,
+        )
+        l_value.pack(side="right")
+        self._bind_drag(l_value)
+
+        return l_name, l_value
 
     def update_monitor_values(self, data_dict: Dict[str, Any]):
         """
         Update displayed telemetry values.
 
+        Changed texts are queued and applied together from a single idle
+        callback; labels whose text is unchanged are left untouched. Nothing
+        is done while the window is unmapped.
+
         Args:
             data_dict: Dict of var_name -> value
         """
+        if not self._viewable:
+            return
+        last_text = self._last_text
+        pending = self._pending_text
+        widgets = self.monitor_widgets
+        formatters = self.VALUE_FORMATTERS
         for var_name, value in data_dict.items():
-            if var_name in self.monitor_widgets:
-                _name_label, value_label = self.monitor_widgets[var_name]
-                if value is None:
-                    text = "--"
-                elif isinstance(value, float):
-                    text = f"{value:.3f}"
-                else:
-                    text = str(value)
-                try:
-                    value_label.config(text=text)
-                except Exception:
-                    pass
+            if var_name not in widgets:
+                continue
+            fmt = formatters.get(type(value))
+            text = fmt(value) if fmt is not None else self._format_value(value)
+            if last_text.get(var_name) == text:
+                pending.pop(var_name, None)
+                continue
+            pending[var_name] = text
+
+        if pending and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_pending)
+
+    @staticmethod
+    def _format_value(value: Any) -> str:
+        """Format values of types missing from VALUE_FORMATTERS."""
+
+        if isinstance(value, float):
+            return format(value, ".3f")
+        return str(value)
+
+    def _flush_pending(self):
+        """Apply all queued value label texts in one pass."""
+
+        self._flush_scheduled = False
+        pending = self._pending_text
+        last_text = self._last_text
+        for var_name, text in pending.items():
+            widgets = self.monitor_widgets.get(var_name)
+            if widgets is None:
+                continue
+            try:
+                widgets[1].config(text=text)
+            except Exception:
+                continue
+            last_text[var_name] = text
+        pending.clear()
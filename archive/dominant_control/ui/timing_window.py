@@ -1,6 +1,7 @@
 """Timing configuration window for Dominant Control."""
 
-from typing import Callable
+import re
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import tkinter as tk
 from tkinter import messagebox, ttk
@@ -8,262 +9,305 @@ from tkinter import messagebox, ttk
 from dominant_control.config import DEFAULT_TIMING_PROFILES, GLOBAL_TIMING
 from dominant_control.input_engine import _normalize_timing_config
 
+_PROFILE_CHOICES = (
+    ("😈 Aggressive (fast, robotic)", "aggressive"),
+    ("🙂 Casual (more relaxed)", "casual"),
+    ("😎 Relaxed (well-spaced)", "relaxed"),
+    ("🤖 BOT (experimental, near-zero delay)", "bot"),
+    ("🛠 Custom (define values below)", "custom"),
+)
+
+# (label, row, column) for the label/entry pairs of a settings panel.
+_ENTRY_SPECS = (
+    ("Press Min (ms):", 0, 0),
+    ("Press Max (ms):", 0, 2),
+    ("Interval Min (ms):", 1, 0),
+    ("Interval Max (ms):", 1, 2),
+)
+
+# Numeric settings in the order of a settings panel's "value_vars".
+_VALUE_KEYS = (
+    "press_min_ms",
+    "press_max_ms",
+    "interval_min_ms",
+    "interval_max_ms",
+    "random_range_ms",
+)
+
+_VALUE_NAMES = ("Press Min", "Press Max", "Interval Min", "Interval Max", "Range")
+
+_INT_RE = re.compile(r"-?\d+")
+# Intermediate states accepted while typing ("" and a lone "-").
+_PARTIAL_INT_RE = re.compile(r"-?\d*")
+
+_DEFAULT_STRINGS = {
+    profile: tuple(str(settings.get(key, 0)) for key in _VALUE_KEYS)
+    for profile, settings in DEFAULT_TIMING_PROFILES.items()
+}
+_EMPTY_DEFAULTS = ("0",) * len(_VALUE_KEYS)
+
 
 class GlobalTimingWindow(tk.Toplevel):
     """Window for configuring input timing profiles."""
 
     def __init__(self, parent, callback_save: Callable):
         super().__init__(parent)
+        # Stay unmapped while the widgets are built so the layout is
+        # computed once, when the window is first shown.
+        self.withdraw()
         self.title("Timing Adjustments (Anti-Detection)")
         self.geometry("420x420")
         self.callback = callback_save
+        # GLOBAL_TIMING only changes through save_all, so normalize it once
+        # instead of on every profile click.
+        self._timing_cache = _normalize_timing_config(GLOBAL_TIMING)
 
         notebook = ttk.Notebook(self)
         notebook.pack(fill="both", expand=True, padx=10, pady=10)
 
-        timing_frame = tk.Frame(notebook)
+        timing_frame = ttk.Frame(notebook)
         notebook.add(timing_frame, text="Timing")
 
         # Profile selection
-        profiles_frame = tk.LabelFrame(timing_frame, text="Behavior Profiles")
+        profiles_frame = ttk.LabelFrame(timing_frame, text="Behavior Profiles")
         profiles_frame.pack(fill="x", padx=10, pady=5)
 
         self.var_profile = tk.StringVar(
             value=GLOBAL_TIMING.get("profile", "aggressive")
         )
 
-        tk.Radiobutton(
-            profiles_frame,
-            text="😈 Aggressive (fast, robotic)",
-            variable=self.var_profile,
-            value="aggressive",
-            command=self._on_profile_change
-        ).pack(anchor="w", padx=5, pady=2)
-
-        tk.Radiobutton(
-            profiles_frame,
-            text="🙂 Casual (more relaxed)",
-            variable=self.var_profile,
-            value="casual",
-            command=self._on_profile_change
-        ).pack(anchor="w", padx=5, pady=2)
-
-        tk.Radiobutton(
-            profiles_frame,
-            text="😎 Relaxed (well-spaced)",
-            variable=self.var_profile,
-            value="relaxed",
-            command=self._on_profile_change
-        ).pack(anchor="w", padx=5, pady=2)
-
-        tk.Radiobutton(
-            profiles_frame,
-            text="🤖 BOT (experimental, near-zero delay)",
-            variable=self.var_profile,
-            value="bot",
-            command=self._on_profile_change
-        ).pack(anchor="w", padx=5, pady=2)
-
-        tk.Radiobutton(
-            profiles_frame,
-            text="🛠 Custom (define values below)",
-            variable=self.var_profile,
-            value="custom",
-            command=self._on_profile_change
-        ).pack(anchor="w", padx=5, pady=(2, 5))
-
-        # Profile settings
-        self.custom_frame = tk.LabelFrame(
+        last_choice = len(_PROFILE_CHOICES) - 1
+        for index, (text, value) in enumerate(_PROFILE_CHOICES):
+            ttk.Radiobutton(
+                profiles_frame,
+                text=text,
+                variable=self.var_profile,
+                value=value,
+                command=self._on_profile_change
+            ).pack(
+                anchor="w", padx=5, pady=(2, 5) if index == last_choice else 2
+            )
+
+        # Profile settings: one panel per profile, built on first selection
+        # and swapped in afterwards instead of rewriting a shared set of
+        # entries on every click.
+        self.custom_frame = ttk.LabelFrame(
             timing_frame,
             text="Profile Settings"
         )
         self.custom_frame.pack(fill="x", padx=10, pady=10)
 
-        tk.Label(self.custom_frame, text="Press Min (ms):").grid(
-            row=0, column=0, sticky="w", padx=5, pady=2
-        )
-        self.entry_press_min = tk.Entry(self.custom_frame, width=8)
-        self.entry_press_min.grid(row=0, column=1, padx=5, pady=2)
+        # One Tcl command shared by every numeric entry rejects non-digit
+        # keystrokes.
+        self._vcmd = (self.register(self._is_partial_int), "%P")
+        self._panels: Dict[str, Dict[str, Any]] = {}
+        self._panel: Optional[Dict[str, Any]] = None
 
-        tk.Label(self.custom_frame, text="Press Max (ms):").grid(
-            row=0, column=2, sticky="w", padx=5, pady=2
-        )
-        self.entry_press_max = tk.Entry(self.custom_frame, width=8)
-        self.entry_press_max.grid(row=0, column=3, padx=5, pady=2)
+        # Save button
+        # Kept as a tk.Button: native ttk themes ignore a button background.
+        tk.Button(
+            self,
+            text="💾 SAVE",
+            command=self.save_all,
+            bg="#90ee90",
+            height=2
+        ).pack(fill="x", padx=10, pady=10)
 
-        tk.Label(self.custom_frame, text="Interval Min (ms):").grid(
-            row=1, column=0, sticky="w", padx=5, pady=2
-        )
-        self.entry_interval_min = tk.Entry(self.custom_frame, width=8)
-        self.entry_interval_min.grid(row=1, column=1, padx=5, pady=2)
+        self._on_profile_change()
 
-        tk.Label(self.custom_frame, text="Interval Max (ms):").grid(
-            row=1, column=2, sticky="w", padx=5, pady=2
-        )
-        self.entry_interval_max = tk.Entry(self.custom_frame, width=8)
-        self.entry_interval_max.grid(row=1, column=3, padx=5, pady=2)
+        self.update_idletasks()
+        self.deiconify()
 
-        self.var_random = tk.BooleanVar()
-        self.check_random = tk.Checkbutton(
-            self.custom_frame,
+    def _on_profile_change(self):
+        """Handle profile selection change."""
+        profile = self.var_profile.get()
+        panel = self._panels.get(profile)
+        if panel is None:
+            panel = self._build_panel(profile)
+            self._panels[profile] = panel
+        if panel is self._panel:
+            return
+        if self._panel is not None:
+            self._panel["frame"].pack_forget()
+        self._panel = panel
+        panel["frame"].pack(fill="x")
+
+    def _build_panel(self, profile: str) -> Dict[str, Any]:
+        """Create the settings widgets for ``profile`` and load its values."""
+        frame = ttk.Frame(self.custom_frame)
+        vcmd = self._vcmd
+
+        # Entries are written through these variables (in _VALUE_KEYS order),
+        # which also works while an entry is disabled.
+        value_vars = []
+        entries = []
+        for label, row, column in _ENTRY_SPECS:
+            ttk.Label(frame, text=label).grid(
+                row=row, column=column, sticky="w", padx=5, pady=2
+            )
+            var = tk.StringVar(self)
+            value_vars.append(var)
+            entry = ttk.Entry(
+                frame,
+                width=8,
+                textvariable=var,
+                validate="key",
+                validatecommand=vcmd,
+            )
+            entry.grid(row=row, column=column + 1, padx=5, pady=2)
+            entries.append(entry)
+
+        var_random = tk.BooleanVar(self)
+        check_random = ttk.Checkbutton(
+            frame,
             text="Randomize (humanize)",
-            variable=self.var_random,
+            variable=var_random,
             command=self._toggle_random
         )
-        self.check_random.grid(
+        check_random.grid(
             row=2, column=0, columnspan=4, sticky="w", padx=5, pady=(5, 2)
         )
 
-        tk.Label(self.custom_frame, text="Range (+/- ms):").grid(
+        ttk.Label(frame, text="Range (+/- ms):").grid(
             row=3, column=0, sticky="w", padx=5, pady=2
         )
-        self.entry_random_range = tk.Entry(self.custom_frame, width=8)
-        self.entry_random_range.grid(row=3, column=1, padx=5, pady=2)
+        var = tk.StringVar(self)
+        value_vars.append(var)
+        entry_random_range = ttk.Entry(
+            frame,
+            width=8,
+            textvariable=var,
+            validate="key",
+            validatecommand=vcmd,
+        )
+        entry_random_range.grid(row=3, column=1, padx=5, pady=2)
 
-        self.var_customize = tk.BooleanVar()
-        self.check_customize = tk.Checkbutton(
-            self.custom_frame,
+        var_customize = tk.BooleanVar(self)
+        ttk.Checkbutton(
+            frame,
             text="Customize this profile",
-            variable=self.var_customize,
+            variable=var_customize,
             command=self._toggle_customize
-        )
-        self.check_customize.grid(
-            row=4, column=0, columnspan=2, sticky="w", padx=5, pady=(5, 2)
-        )
+        ).grid(row=4, column=0, columnspan=2, sticky="w", padx=5, pady=(5, 2))
 
-        tk.Button(
-            self.custom_frame,
+        ttk.Button(
+            frame,
             text="Reset to Defaults",
             command=self._reset_profile_defaults
         ).grid(row=4, column=2, columnspan=2, sticky="e", padx=5, pady=(5, 2))
 
         for i in range(4):
-            self.custom_frame.columnconfigure(i, weight=1)
-
-        # Save button
-        tk.Button(
-            self,
-            text="💾 SAVE",
-            command=self.save_all,
-            bg="#90ee90",
-            height=2
-        ).pack(fill="x", padx=10, pady=10)
-
-        self._on_profile_change()
-
-    def _on_profile_change(self):
-        """Handle profile selection change."""
-        profile = self.var_profile.get()
-        timing_cfg = _normalize_timing_config(GLOBAL_TIMING)
+            frame.columnconfigure(i, weight=1)
+
+        panel = {
+            "frame": frame,
+            "profile": profile,
+            "value_vars": tuple(value_vars),
+            "var_random": var_random,
+            "var_customize": var_customize,
+            "entry_random_range": entry_random_range,
+            # Tcl list of the widgets locked while the profile uses its
+            # defaults, so _toggle_customize switches them in one call.
+            "toggle_paths": " ".join(
+                str(widget)
+                for widget in (*entries, check_random, entry_random_range)
+            ),
+        }
+
+        timing_cfg = self._timing_cache
         customized = timing_cfg.get("profile_customized", {}).get(profile, False)
-        defaults = DEFAULT_TIMING_PROFILES.get(profile, {})
-        settings = timing_cfg.get("profile_settings", {}).get(profile, defaults)
-        values = settings if customized else defaults
-
-        self.var_customize.set(customized)
-        self._set_entry_value(self.entry_press_min, values.get("press_min_ms", 0))
-        self._set_entry_value(self.entry_press_max, values.get("press_max_ms", 0))
-        self._set_entry_value(
-            self.entry_interval_min, values.get("interval_min_ms", 0)
-        )
-        self._set_entry_value(
-            self.entry_interval_max, values.get("interval_max_ms", 0)
-        )
-        self.var_random.set(values.get("random_enabled", False))
-        self._set_entry_value(
-            self.entry_random_range, values.get("random_range_ms", 0)
-        )
-
-        self._toggle_customize()
-
-    def _set_entry_value(self, entry: tk.Entry, value: int) -> None:
-        entry.delete(0, tk.END)
-        entry.insert(0, str(value))
-
-    def _toggle_customize(self):
+        var_customize.set(customized)
+        if customized:
+            settings = timing_cfg.get("profile_settings", {}).get(
+                profile, DEFAULT_TIMING_PROFILES.get(profile, {})
+            )
+            self._set_entry_values(
+                panel, tuple(str(settings.get(key, 0)) for key in _VALUE_KEYS)
+            )
+            var_random.set(settings.get("random_enabled", False))
+        # Non-customized profiles get their defaults from _toggle_customize.
+
+        self._toggle_customize(panel)
+        return panel
+
+    @staticmethod
+    def _is_partial_int(proposed: str) -> bool:
+        return _PARTIAL_INT_RE.fullmatch(proposed) is not None
+
+    @staticmethod
+    def _set_entry_values(
+        panel: Dict[str, Any], values: Tuple[str, ...]
+    ) -> None:
+        for var, value in zip(panel["value_vars"], values):
+            var.set(value)
+
+    def _toggle_customize(self, panel: Optional[Dict[str, Any]] = None):
         """Enable customization only when checked."""
-        enabled = self.var_customize.get()
+        panel = panel or self._panel
+        enabled = panel["var_customize"].get()
         state = "normal" if enabled else "disabled"
 
-        for widget in [
-            self.entry_press_min,
-            self.entry_press_max,
-            self.entry_interval_min,
-            self.entry_interval_max,
-            self.check_random,
-            self.entry_random_range,
-        ]:
-            widget.config(state=state)
+        self.tk.eval(
+            f"foreach w {{{panel['toggle_paths']}}} "
+            f"{{$w configure -state {state}}}"
+        )
 
         if not enabled:
-            self._apply_default_values()
+            self._apply_default_values(panel)
 
-        self._toggle_random()
+        self._toggle_random(panel)
 
-    def _apply_default_values(self) -> None:
-        profile = self.var_profile.get()
-        defaults = DEFAULT_TIMING_PROFILES.get(profile, {})
-        self._set_entry_value(self.entry_press_min, defaults.get("press_min_ms", 0))
-        self._set_entry_value(self.entry_press_max, defaults.get("press_max_ms", 0))
-        self._set_entry_value(
-            self.entry_interval_min, defaults.get("interval_min_ms", 0)
+    def _apply_default_values(self, panel: Dict[str, Any]) -> None:
+        profile = panel["profile"]
+        self._set_entry_values(
+            panel, _DEFAULT_STRINGS.get(profile, _EMPTY_DEFAULTS)
         )
-        self._set_entry_value(
-            self.entry_interval_max, defaults.get("interval_max_ms", 0)
-        )
-        self.var_random.set(defaults.get("random_enabled", False))
-        self._set_entry_value(
-            self.entry_random_range, defaults.get("random_range_ms", 0)
+        panel["var_random"].set(
+            DEFAULT_TIMING_PROFILES.get(profile, {}).get("random_enabled", False)
         )
 
-    def _toggle_random(self):
+    def _toggle_random(self, panel: Optional[Dict[str, Any]] = None):
         """Handle randomization toggle."""
+        panel = panel or self._panel
         state = (
             "normal"
-            if self.var_random.get() and self.var_customize.get()
+            if panel["var_random"].get() and panel["var_customize"].get()
             else "disabled"
         )
-        self.entry_random_range.config(state=state)
+        panel["entry_random_range"].config(state=state)
 
     def _reset_profile_defaults(self):
         """Reset current profile to default values."""
-        self.var_customize.set(False)
-        self._apply_default_values()
+        self._panel["var_customize"].set(False)
         self._toggle_customize()
 
     def save_all(self):
         """Save timing configuration."""
         profile = self.var_profile.get()
-        GLOBAL_TIMING["profile"] = profile
-
-        customized = self.var_customize.get()
-        GLOBAL_TIMING.setdefault("profile_customized", {})
-        GLOBAL_TIMING.setdefault("profile_settings", {})
-        GLOBAL_TIMING["profile_customized"][profile] = customized
+        panel = self._panel
+        customized = panel["var_customize"].get()
 
         settings = DEFAULT_TIMING_PROFILES.get(profile, {}).copy()
         if customized:
-            try:
-                settings["press_min_ms"] = int(self.entry_press_min.get())
-                settings["press_max_ms"] = int(self.entry_press_max.get())
-                settings["interval_min_ms"] = int(
-                    self.entry_interval_min.get()
-                )
-                settings["interval_max_ms"] = int(
-                    self.entry_interval_max.get()
-                )
-                settings["random_enabled"] = self.var_random.get()
-                settings["random_range_ms"] = int(
-                    self.entry_random_range.get()
-                )
-            except ValueError:
-                messagebox.showerror(
-                    "Error",
-                    "Please use numbers only in Customize mode."
-                )
-                return
+            raw_values = tuple(
+                var.get().strip() for var in panel["value_vars"]
+            )
+            for name, text in zip(_VALUE_NAMES, raw_values):
+                if not _INT_RE.fullmatch(text):
+                    messagebox.showerror(
+                        "Error",
+                        f"Please use numbers only in Customize mode ({name})."
+                    )
+                    return
+            settings.update(zip(_VALUE_KEYS, map(int, raw_values)))
+            settings["random_enabled"] = panel["var_random"].get()
 
+        GLOBAL_TIMING["profile"] = profile
+        GLOBAL_TIMING.setdefault("profile_customized", {})
+        GLOBAL_TIMING.setdefault("profile_settings", {})
+        GLOBAL_TIMING["profile_customized"][profile] = customized
         GLOBAL_TIMING["profile_settings"][profile] = settings
+        self._timing_cache = _normalize_timing_config(GLOBAL_TIMING)
 
         self.callback(GLOBAL_TIMING)
         self.destroy()
@@ -6,17 +6,30 @@ class ScrollableFrame(tk.Frame):
     Use self.inner as the container for child widgets.
     """
 
+    _WHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
 
         canvas = tk.Canvas(self, borderwidth=0, highlightthickness=0)
         scrollbar = tk.Scrollbar(self, orient="vertical", command=canvas.yview)
         self.inner = tk.Frame(canvas)
+        self._canvas = canvas
+
+        # Mouse wheel support scoped to this frame: a private bindtag is added
+        # to the canvas and its descendants instead of hijacking bind_all.
+        self._wheel_tag = f"ScrollableFrameWheel{id(self)}"
 
-        self.inner.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Recompute the scrollregion once per layout settle instead of on
+        # every intermediate <Configure> event. Rows added since the last
+        # settle are picked up for wheel scrolling in the same pass.
+        self._scrollregion_after = None
+        # Heights cached from the last layout pass; wheel events are ignored
+        # while the content fits the viewport.
+        self._content_h = 0
+        self._view_h = 0
+        self.inner.bind("<Configure>", self._schedule_scrollregion)
+        canvas.bind("<Configure>", self._schedule_scrollregion)
 
         canvas.create_window((0, 0), window=self.inner, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -24,15 +37,57 @@ class ScrollableFrame(tk.Frame):
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Mouse wheel support (bind only while hovered)
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        self.bind_class(self._wheel_tag, "<MouseWheel>", self._on_mousewheel)
+        self.bind_class(self._wheel_tag, "<Button-4>", self._on_wheel_up)
+        self.bind_class(self._wheel_tag, "<Button-5>", self._on_wheel_down)
+
+    def _tag_descendants(self):
+        wheel_tag = self._wheel_tag
+        stack = [self._canvas]
+        while stack:
+            widget = stack.pop()
+            tags = widget.bindtags()
+            if wheel_tag not in tags:
+                widget.bindtags((tags[0], wheel_tag) + tags[1:])
+            stack.extend(widget.winfo_children())
+
+    def _apply_scrollregion(self):
+        self._scrollregion_after = None
+        canvas = self._canvas
+        bbox = canvas.bbox("all")
+        canvas.configure(scrollregion=bbox)
+        self._content_h = bbox[3] - bbox[1] if bbox else 0
+        self._tag_descendants()
+
+    def _schedule_scrollregion(self, event):
+        if event.widget is self._canvas:
+            self._view_h = event.height
+        # Skip the 1px-wide events Tk emits before the canvas is realized;
+        # the canvas' own <Configure> catches up once it has a real size.
+        if self._scrollregion_after is not None or self._canvas.winfo_width() <= 1:
+            return
+        self._scrollregion_after = self._canvas.after_idle(self._apply_scrollregion)
+
+    def _on_mousewheel(self, event):
+        if self._content_h <= self._view_h:
+            return
+        # Integer division truncating toward zero, like int(delta / 120).
+        delta = event.delta
+        steps = delta // 120 if delta >= 0 else -(-delta // 120)
+        self._canvas.yview_scroll(-steps, "units")
 
-        def _bind_mousewheel(_event):
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+    def _on_wheel_up(self, _event):
+        if self._content_h > self._view_h:
+            self._canvas.yview_scroll(-1, "units")
 
-        def _unbind_mousewheel(_event):
-            canvas.unbind_all("<MouseWheel>")
+    def _on_wheel_down(self, _event):
+        if self._content_h > self._view_h:
+            self._canvas.yview_scroll(1, "units")
 
-        canvas.bind("<Enter>", _bind_mousewheel)
-        canvas.bind("<Leave>", _unbind_mousewheel)
+    def destroy(self):
+        if self._scrollregion_after is not None:
+            self._canvas.after_cancel(self._scrollregion_after)
+            self._scrollregion_after = None
+        for sequence in self._WHEEL_SEQUENCES:
+            self.unbind_class(self._wheel_tag, sequence)
+        super().destroy()
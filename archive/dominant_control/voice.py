@@ -45,10 +45,20 @@ class VoiceListener:
             "VoiceListener", interval_s=2.0, timeout_s=7.0, on_trip=self._recover_listener
         )
 
-    def set_phrases(self, phrases: Dict[str, Callable]):
-        """Replace the phrase-to-callback map."""
+    def set_phrases(self, phrases: Dict[str, Callable], normalized: bool = False):
+        """Replace the phrase-to-callback map.
+
+        Args:
+            phrases: Phrase -> callback mapping
+            normalized: True when keys are already stripped, lowercased and
+                non-empty, so they can be used as-is
+        """
+        if normalized:
+            callbacks = dict(phrases)
+        else:
+            callbacks = {k.strip().lower(): v for k, v in phrases.items() if k}
         with self.lock:
-            self.callbacks = {k.strip().lower(): v for k, v in phrases.items() if k}
+            self.callbacks = callbacks
 
     def set_enabled(self, enabled: bool):
         """Start or stop the listener based on user preference."""
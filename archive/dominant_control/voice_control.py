@@ -2,24 +2,60 @@
 
 from __future__ import annotations
 
-import threading
-from typing import Any, Callable, Dict, List
+import os
+import sys
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
 import keyboard
 
-from dominant_control.config import VOICE_TUNING_DEFAULTS
+from dominant_control.config import VOICE_TUNING_DEFAULTS, register_shutdown_hook
 from dominant_control.dependencies import HAS_SPEECH, HAS_VOSK
 from dominant_control.input_manager import input_manager
 from dominant_control.voice import VoiceTestDialog, voice_listener
+from dominant_control.workers import DaemonWorkerPool
+
+
+def _normalize_phrase(phrase: Optional[str]) -> str:
+    """Return the interned lookup key for a configured voice phrase."""
+
+    if not phrase:
+        return ""
+    return sys.intern(phrase.strip().lower())
 
 
 class VoiceControlManager:
     """Centralizes voice setup, tuning, and hotkey registration."""
 
+    TUNING_DEBOUNCE_MS = 200
+    # Adjustments that can run at once; further triggers queue behind them.
+    ACTION_WORKERS = 8
+
     def __init__(self, app):
         self.app = app
         self.voice_phrase_map: Dict[str, Callable] = {}
-        self._hotkey_handles: List[Any] = []
+        # Only hotkeys added here; hooks owned by other modules are untouched.
+        self._hotkey_handles: Set[Any] = set()
+        # (vosk_model_path, display name) from the last status refresh.
+        self._model_basename_cache = ("", "")
+        # Shared daemon workers for preset/combo actions; threads start on
+        # the first trigger.
+        self._executor = DaemonWorkerPool(self.ACTION_WORKERS, "dc-action")
+        register_shutdown_hook(self.shutdown)
+        # Pending Tk ``after`` id for a debounced tuning flush.
+        self._tuning_after_id: Optional[str] = None
+        # Last tuning dict sent to the voice listener.
+        self._last_tuning: Optional[Dict[str, Any]] = None
+        # (engine, model path) last passed to voice_listener.set_engine.
+        self._last_engine_setting: Optional[Tuple[str, str]] = None
+        # Phrase map and enabled state last handed to voice_listener.
+        self._listener_phrase_map: Optional[Dict[str, Callable]] = None
+        self._last_voice_enabled: Optional[bool] = None
+        # Presets behind the current registrations, and the saved snapshot
+        # used in their place until the tabs are built.
+        self._registered_presets: Tuple[list, list] = ([], [])
+        self._startup_snapshot: Optional[Dict[str, Any]] = None
+        # Signature of the preset config behind the current registrations.
+        self._last_config_sig: Optional[tuple] = None
 
     # Voice tuning -----------------------------------------------------
     def tuning_config(self) -> Dict[str, Any]:
@@ -73,44 +109,86 @@ class VoiceControlManager:
     def apply_voice_tuning(self, persist: bool = False):
         """Send current tuning settings to the listener and optionally save."""
 
-        tuning = self.tuning_config()
-        voice_listener.update_tuning(tuning)
+        self._push_tuning(self.tuning_config())
         if persist:
             self.app.schedule_save()
 
+    def _push_tuning(self, tuning: Dict[str, Any]) -> bool:
+        """Send ``tuning`` to the listener unless it was the last one sent.
+
+        Returns:
+            True when the listener was updated.
+        """
+
+        if tuning == self._last_tuning:
+            return False
+        self._last_tuning = tuning
+        voice_listener.update_tuning(tuning)
+        return True
+
     def on_voice_tuning_changed(self, *_):
-        """Propagate UI changes to the listener and persist them."""
+        """Propagate UI changes to the listener and persist them.
 
+        Keystrokes in the tuning fields are coalesced so only the settled
+        value reaches the listener and the config file.
+        """
+
+        root = self.app.root
+        if self._tuning_after_id is not None:
+            root.after_cancel(self._tuning_after_id)
+        self._tuning_after_id = root.after(
+            self.TUNING_DEBOUNCE_MS, self._flush_tuning
+        )
+
+    def _flush_tuning(self):
+        self._tuning_after_id = None
         self.apply_voice_tuning(persist=True)
 
     def set_voice_tuning_vars(self, tuning: Dict[str, Any]):
-        """Populate Tk variables with stored voice tuning values."""
+        """Populate Tk variables with stored voice tuning values.
 
-        self.app.voice_ambient_duration.set(
-            tuning.get("ambient_duration", VOICE_TUNING_DEFAULTS["ambient_duration"])
-        )
-        self.app.voice_initial_timeout.set(
-            tuning.get("initial_timeout", VOICE_TUNING_DEFAULTS["initial_timeout"])
-        )
-        self.app.voice_continuous_timeout.set(
-            tuning.get(
-                "continuous_timeout",
-                VOICE_TUNING_DEFAULTS["continuous_timeout"],
-            )
-        )
-        self.app.voice_phrase_time_limit.set(
-            tuning.get(
-                "phrase_time_limit", VOICE_TUNING_DEFAULTS["phrase_time_limit"]
-            )
-        )
+        Variables already holding the stored value are not written, so their
+        traces (and the save they schedule) do not fire.
+        """
+
+        app = self.app
+        defaults = VOICE_TUNING_DEFAULTS
 
         energy_threshold = tuning.get("energy_threshold")
-        self.app.voice_energy_threshold.set(
-            "" if energy_threshold in {None, ""} else str(energy_threshold)
-        )
-        self.app.voice_dynamic_energy.set(
-            tuning.get("dynamic_energy", VOICE_TUNING_DEFAULTS["dynamic_energy"])
+        fields = (
+            (
+                app.voice_ambient_duration,
+                tuning.get("ambient_duration", defaults["ambient_duration"]),
+            ),
+            (
+                app.voice_initial_timeout,
+                tuning.get("initial_timeout", defaults["initial_timeout"]),
+            ),
+            (
+                app.voice_continuous_timeout,
+                tuning.get("continuous_timeout", defaults["continuous_timeout"]),
+            ),
+            (
+                app.voice_phrase_time_limit,
+                tuning.get("phrase_time_limit", defaults["phrase_time_limit"]),
+            ),
+            (
+                app.voice_energy_threshold,
+                "" if energy_threshold in (None, "") else str(energy_threshold),
+            ),
+            (
+                app.voice_dynamic_energy,
+                tuning.get("dynamic_energy", defaults["dynamic_energy"]),
+            ),
         )
+        for var, value in fields:
+            try:
+                if str(var.get()) == str(value):
+                    continue
+            except Exception:
+                # Unparsable current contents; overwrite them
+                pass
+            var.set(value)
 
     # Voice engine setup -----------------------------------------------
     def format_vosk_status(self) -> str:
@@ -131,9 +209,10 @@ class VoiceControlManager:
             return f"Model error: {voice_listener._vosk_error}"
 
         if voice_listener.vosk_model is not None:
-            import os
-
-            name = os.path.basename(model_path.rstrip(os.sep)) or model_path
+            cached_path, name = self._model_basename_cache
+            if cached_path != model_path:
+                name = os.path.basename(model_path.rstrip(os.sep)) or model_path
+                self._model_basename_cache = (model_path, name)
             return f"Vosk model: {name}"
 
         return "Loading Vosk model..."
@@ -170,7 +249,7 @@ class VoiceControlManager:
     def update_voice_controls(self):
         """Refresh UI state and listener config for voice engine selection."""
 
-        voice_listener.update_tuning(self.tuning_config())
+        self._push_tuning(self.tuning_config())
         self.app.apply_audio_preferences()
         engine = self.app.voice_engine.get()
         if engine == "vosk" and not HAS_VOSK:
@@ -181,15 +260,28 @@ class VoiceControlManager:
                 self.app.voice_engine_combo.set(engine)
 
         if engine == "vosk":
-            voice_listener.set_engine(engine, self.app.vosk_model_path.get())
+            self._set_engine(engine, self.app.vosk_model_path.get())
         else:
-            voice_listener.set_engine("speech", "")
+            self._set_engine("speech", "")
 
         btn_state = "normal" if engine == "vosk" and HAS_VOSK else "disabled"
         if self.app.btn_vosk_model:
             self.app.btn_vosk_model.config(state=btn_state)
         self.app.vosk_status_var.set(self.format_vosk_status())
 
+    def _set_engine(self, engine: str, model_path: str):
+        """Forward the engine choice unless it matches the last one applied.
+
+        A failed Vosk load is always retried so re-selecting the same folder
+        after fixing it reloads the model.
+        """
+
+        setting = (engine, model_path)
+        if setting == self._last_engine_setting and not voice_listener._vosk_error:
+            return
+        self._last_engine_setting = setting
+        voice_listener.set_engine(engine, model_path)
+
     def open_voice_test_dialog(self):
         """Open the dialog that validates configured voice commands."""
 
@@ -219,48 +311,65 @@ class VoiceControlManager:
         self.app.schedule_save()
 
     # Hotkey/phrase registration --------------------------------------
+    def _submit(self, func: Callable, *args: Any):
+        """Run ``func`` on the shared action worker pool."""
+
+        self._executor.submit(func, *args)
+
+    def shutdown(self):
+        """Stop the action workers, dropping queued and running adjustments."""
+
+        self._executor.shutdown()
+        for controller in self.app.controllers.values():
+            controller.cancel()
+
     def _make_single_action(self, controller, target: float):
         """Create an action that adjusts a single controller to a target."""
 
-        return lambda: threading.Thread(
-            target=controller.adjust_to_target,
-            args=(target,),
-            daemon=True,
-        ).start()
+        return lambda: self._submit(controller.adjust_to_target, target)
+
+    def _make_combo_action(self, values: Dict[str, str]) -> Optional[Callable]:
+        """Create an action that adjusts multiple controllers at once.
 
-    def _make_combo_action(self, values: Dict[str, str]):
-        """Create an action that adjusts multiple controllers at once."""
+        Targets are resolved when the action is built; ``None`` is returned
+        when no entry names a known controller with a numeric value.
+        """
+
+        controllers = self.app.controllers
+        resolved = []
+        for var_name, val_str in values.items():
+            if var_name in controllers and val_str:
+                try:
+                    resolved.append(
+                        (controllers[var_name].adjust_to_target, float(val_str))
+                    )
+                except Exception:
+                    continue
+
+        if not resolved:
+            return None
+
+        app = self.app
+        submit = self._submit
 
         def combo_action():
-            if self.app.app_state != "RUNNING":
+            if app.app_state != "RUNNING":
                 return
 
-            for var_name, val_str in values.items():
-                if var_name in self.app.controllers and val_str:
-                    try:
-                        target = float(val_str)
-                    except Exception:
-                        continue
-
-                    ctrl = self.app.controllers[var_name]
-                    threading.Thread(
-                        target=ctrl.adjust_to_target,
-                        args=(target,),
-                        daemon=True,
-                    ).start()
+            for adjust, target in resolved:
+                submit(adjust, target)
 
         return combo_action
 
-    def _build_voice_phrase_map(self) -> Dict[str, Callable]:
-        """Collect current voice phrases mapped to their actions."""
-
-        voice_phrases: Dict[str, Callable] = {}
+    def _iter_preset_actions(self, tab_presets, combo_presets):
+        """Yield ``(bind, phrase, action)`` for every usable preset.
 
-        for var_name, tab in self.app.tabs.items():
-            config = tab.get_config()
-            controller = self.app.controllers[var_name]
+        Each action closure is built exactly once; ``phrase`` is already
+        normalized by _normalize_phrase and may be empty.
+        """
 
-            for preset in config.get("presets", []):
+        for _var_name, controller, presets in tab_presets:
+            for preset in presets:
                 val_str = preset.get("val")
                 if not val_str:
                     continue
@@ -270,111 +379,219 @@ class VoiceControlManager:
                 except Exception:
                     continue
 
-                phrase = preset.get("voice_phrase", "").strip().lower()
-                if phrase:
-                    voice_phrases[phrase] = self._make_single_action(
-                        controller, target
-                    )
+                yield (
+                    preset.get("bind"),
+                    _normalize_phrase(preset.get("voice_phrase")),
+                    self._make_single_action(controller, target),
+                )
+
+        for preset in combo_presets:
+            action = self._make_combo_action(preset.get("vals", {}))
+            if action is None:
+                continue
+
+            yield (
+                preset.get("bind"),
+                _normalize_phrase(preset.get("voice_phrase")),
+                action,
+            )
 
-        if self.app.combo_tab:
-            combo_config = self.app.combo_tab.get_config()
+    def _build_voice_phrase_map(self) -> Dict[str, Callable]:
+        """Collect current voice phrases mapped to their actions."""
 
-            for preset in combo_config.get("presets", []):
-                values = preset.get("vals", {})
-                phrase = preset.get("voice_phrase", "").strip().lower()
-                if not phrase:
-                    continue
+        tab_presets, combo_presets = self._collect_presets()
+        signature = self._config_signature(
+            tab_presets, combo_presets, self.app.controllers
+        )
+        if signature == self._last_config_sig:
+            return self.voice_phrase_map
 
-                voice_phrases[phrase] = self._make_combo_action(values)
+        return {
+            phrase: action
+            for _bind, phrase, action in self._iter_preset_actions(
+                tab_presets, combo_presets
+            )
+            if phrase
+        }
 
-        return voice_phrases
+    def _collect_presets(self):
+        """Read preset lists from every tab and the combo tab once.
 
-    def register_current_listeners(self):
-        """Register keyboard/joystick listeners based on current config."""
+        Until the tabs exist, the snapshot saved with the last config (see
+        prime_from_snapshot) stands in for them.
+        """
 
-        self.clear_keyboard_hotkeys()
-        input_manager.listeners.clear()
-        voice_phrases: Dict[str, Callable] = {}
+        if not self.app.tabs and self._startup_snapshot:
+            return self._presets_from_snapshot(self._startup_snapshot)
+        self._startup_snapshot = None
 
-        for var_name, tab in self.app.tabs.items():
-            config = tab.get_config()
-            controller = self.app.controllers[var_name]
+        tab_presets = [
+            (
+                var_name,
+                self.app.controllers[var_name],
+                tab.get_config().get("presets", []),
+            )
+            for var_name, tab in self.app.tabs.items()
+        ]
+        combo_presets = (
+            self.app.combo_tab.get_config().get("presets", [])
+            if self.app.combo_tab
+            else []
+        )
+        return tab_presets, combo_presets
 
-            for preset in config.get("presets", []):
-                bind = preset.get("bind")
-                val_str = preset.get("val")
-                if not val_str:
-                    continue
+    def _presets_from_snapshot(self, snapshot: Dict[str, Any]):
+        controllers = self.app.controllers
+        tab_presets = [
+            (var_name, controllers[var_name], presets)
+            for var_name, presets in snapshot.get("tabs", {}).items()
+            if var_name in controllers
+        ]
+        return tab_presets, snapshot.get("combo", [])
 
-                try:
-                    target = float(val_str)
-                except Exception:
-                    continue
+    def prime_from_snapshot(self, snapshot: Optional[Dict[str, Any]]):
+        """Keep a saved registration snapshot for use before tabs are built."""
 
-                action = self._make_single_action(controller, target)
-                if bind:
-                    if bind.startswith("KEY:"):
-                        key_name = bind.split(":", 1)[1].lower()
-                        handle = keyboard.add_hotkey(key_name, action)
-                        self._hotkey_handles.append(handle)
-                    else:
-                        input_manager.listeners[bind] = action
-
-                phrase = preset.get("voice_phrase", "").strip().lower()
-                if phrase:
-                    voice_phrases[phrase] = action
-
-        if self.app.combo_tab:
-            combo_config = self.app.combo_tab.get_config()
-
-            for preset in combo_config.get("presets", []):
-                bind = preset.get("bind")
-                values = preset.get("vals", {})
-
-                action = self._make_combo_action(values)
-                if bind:
-                    if bind.startswith("KEY:"):
-                        key_name = bind.split(":", 1)[1].lower()
-                        handle = keyboard.add_hotkey(key_name, action)
-                        self._hotkey_handles.append(handle)
-                    else:
-                        input_manager.listeners[bind] = action
-
-                phrase = preset.get("voice_phrase", "").strip().lower()
-                if phrase:
-                    voice_phrases[phrase] = action
+        self._startup_snapshot = snapshot if isinstance(snapshot, dict) else None
 
-        self.voice_phrase_map = voice_phrases
+    def registration_snapshot(self) -> Dict[str, Any]:
+        """Return the presets behind the current registrations for saving."""
+
+        # Nothing registered yet: keep the loaded snapshot instead of saving
+        # an empty one over it.
+        if self._last_config_sig is None and self._startup_snapshot is not None:
+            return self._startup_snapshot
+
+        tab_presets, combo_presets = self._registered_presets
+        return {
+            "tabs": {
+                var_name: [
+                    {
+                        "bind": preset.get("bind"),
+                        "val": preset.get("val"),
+                        "voice_phrase": preset.get("voice_phrase", ""),
+                    }
+                    for preset in presets
+                ]
+                for var_name, _controller, presets in tab_presets
+            },
+            "combo": [
+                {
+                    "bind": preset.get("bind"),
+                    "vals": preset.get("vals", {}),
+                    "voice_phrase": preset.get("voice_phrase", ""),
+                }
+                for preset in combo_presets
+            ],
+        }
+
+    @staticmethod
+    def _config_signature(tab_presets, combo_presets, controllers) -> tuple:
+        """Summarize everything that affects hotkeys, listeners and phrases."""
+
+        return (
+            tuple(
+                (
+                    var_name,
+                    id(controller),
+                    tuple(
+                        (
+                            preset.get("bind"),
+                            preset.get("val"),
+                            preset.get("voice_phrase", ""),
+                        )
+                        for preset in presets
+                    ),
+                )
+                for var_name, controller, presets in tab_presets
+            ),
+            tuple(
+                (
+                    preset.get("bind"),
+                    tuple(
+                        (var_name, val_str, id(controllers.get(var_name)))
+                        for var_name, val_str in preset.get("vals", {}).items()
+                    ),
+                    preset.get("voice_phrase", ""),
+                )
+                for preset in combo_presets
+            ),
+        )
+
+    def register_current_listeners(self):
+        """Register keyboard/joystick listeners based on current config."""
+
+        tab_presets, combo_presets = self._collect_presets()
+        signature = self._config_signature(
+            tab_presets, combo_presets, self.app.controllers
+        )
+        # Toggles and engine changes re-enter here with an unchanged config;
+        # keep the existing hotkeys and actions and only refresh the listener.
+        if signature != self._last_config_sig:
+            self._register_bindings(tab_presets, combo_presets)
+            self._last_config_sig = signature
+            self._registered_presets = (tab_presets, combo_presets)
 
         input_manager.active = self.app.app_state == "RUNNING"
         if self.app.app_state != "RUNNING":
-            voice_listener.set_enabled(False)
+            self._set_voice_enabled(False)
         elif self.app.use_voice.get():
-            voice_listener.update_tuning(self.tuning_config())
-            voice_listener.set_engine(
-                self.app.voice_engine.get(),
-                self.app.vosk_model_path.get(),
+            self._push_tuning(self.tuning_config())
+            engine = self.app.voice_engine.get()
+            self._set_engine(
+                engine,
+                self.app.vosk_model_path.get() if engine == "vosk" else "",
             )
-            voice_listener.set_phrases(self.voice_phrase_map)
-            voice_listener.set_enabled(True)
+            # The map is replaced, never mutated, whenever bindings change
+            if self.voice_phrase_map is not self._listener_phrase_map:
+                voice_listener.set_phrases(self.voice_phrase_map, normalized=True)
+                self._listener_phrase_map = self.voice_phrase_map
+            self._set_voice_enabled(True)
         else:
-            voice_listener.set_enabled(False)
+            self._set_voice_enabled(False)
+
+    def _set_voice_enabled(self, enabled: bool):
+        """Toggle the listener unless it is already in the requested state."""
+
+        if enabled == self._last_voice_enabled and voice_listener.running == enabled:
+            return
+        self._last_voice_enabled = enabled
+        voice_listener.set_enabled(enabled)
+
+    def _register_bindings(self, tab_presets, combo_presets):
+        """Rebuild hotkeys, input listeners and the voice phrase map."""
+
+        self.clear_keyboard_hotkeys()
+        input_manager.listeners.clear()
+        voice_phrases: Dict[str, Callable] = {}
+        # Keyboard binds are collected first so a key bound by several presets
+        # is hooked once (last preset wins, as with the listener dict).
+        key_actions: Dict[str, Callable] = {}
+
+        for bind, phrase, action in self._iter_preset_actions(
+            tab_presets, combo_presets
+        ):
+            if bind:
+                if bind.startswith("KEY:"):
+                    key_actions[bind.split(":", 1)[1].lower()] = action
+                else:
+                    input_manager.listeners[bind] = action
+
+            if phrase:
+                voice_phrases[phrase] = action
+
+        for key_name, action in key_actions.items():
+            self._hotkey_handles.add(keyboard.add_hotkey(key_name, action))
+
+        self.voice_phrase_map = voice_phrases
 
     def clear_keyboard_hotkeys(self):
         """Remove all keyboard hotkeys registered by the app."""
 
-        if not hasattr(self, "_hotkey_handles"):
-            self._hotkey_handles = []
-
         for handle in self._hotkey_handles:
             try:
                 keyboard.remove_hotkey(handle)
             except Exception:
                 pass
         self._hotkey_handles.clear()
-
-        try:
-            keyboard.unhook_all_hotkeys()
-        except Exception:
-            pass
-
+        self._last_config_sig = None
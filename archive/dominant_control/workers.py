@@ -0,0 +1,64 @@
+"""Bounded pools of daemon worker threads."""
+
+import queue
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class DaemonWorkerPool:
+    """Run callables on a fixed number of daemon threads.
+
+    Unlike ``ThreadPoolExecutor`` the workers are daemon threads, so work
+    still queued or running (e.g. an adjustment pressing keys) never holds up
+    interpreter exit.
+    """
+
+    def __init__(self, max_workers: int, name: str):
+        self.max_workers = max(1, max_workers)
+        self.name = name
+        self._queue: "queue.Queue[Optional[Tuple[Callable, Tuple[Any, ...]]]]" = (
+            queue.Queue()
+        )
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable, *args: Any) -> None:
+        """Queue ``func(*args)``; workers are started on first use."""
+
+        with self._lock:
+            if not self._threads:
+                for index in range(self.max_workers):
+                    thread = threading.Thread(
+                        target=self._run, name=f"{self.name}-{index}", daemon=True
+                    )
+                    thread.start()
+                    self._threads.append(thread)
+        self._queue.put((func, args))
+
+    def shutdown(self) -> None:
+        """Drop queued work and let the workers exit once idle."""
+
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            for _ in self._threads:
+                self._queue.put(None)
+            self._threads = []
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            func, args = item
+            try:
+                func(*args)
+            except Exception as exc:  # noqa: PERF203
+                print(f"[{self.name}] Task failed: {exc}")
+
+
+__all__ = ["DaemonWorkerPool"]